@@ -17,13 +17,17 @@ Guarantees:
 
 import os
 import json
-from typing import Dict, Any
-from groq import Groq
+import asyncio
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from groq import Groq, AsyncGroq
 
 from app.prompts import (
     RECRUITER_SYSTEM_PROMPT,
     RECRUITER_USER_PROMPT_TEMPLATE,
 )
+from app.hedging import Hedger, get_default_hedger
+from app.circuit_breaker import GROQ_BREAKER, CircuitOpenError
+from app.fallback_scorer import score_resume_locally
 
 
 # ------------------
@@ -34,43 +38,103 @@ from app.prompts import (
 DEFAULT_MODEL = "llama-3.3-70b-versatile"
 MODEL_NAME = os.getenv("GROQ_MODEL", DEFAULT_MODEL)
 
+# Per-request timeout (seconds) for a single Groq call
+REQUEST_TIMEOUT = 60
+
+# Upper bound on in-flight evaluations sharing one event loop
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "32"))
+
 
 # -----------------
 # INTERNAL HELPERS
 # -------------------
 
+def _build_messages(resume_text: str, job_description_text: str) -> List[Dict]:
+    """
+    Chat messages for one recruiter evaluation.
+    """
+    return [
+        {
+            "role": "system",
+            "content": RECRUITER_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": RECRUITER_USER_PROMPT_TEMPLATE.format(
+                resume=resume_text.strip(),
+                job_description=job_description_text.strip(),
+            ),
+        },
+    ]
+
+
+def _completion_params(resume_text: str, job_description_text: str) -> Dict:
+    """
+    Chat completion request body shared by live and bulk (batch) calls.
+    Enables JSON mode to ensure valid output.
+    """
+    return {
+        "model": MODEL_NAME,
+        "messages": _build_messages(resume_text, job_description_text),
+        "response_format": {"type": "json_object"},
+        "temperature": 0.3,
+        "max_tokens": 3000,
+    }
+
+
 def _call_groq(client: Groq, resume_text: str, job_description_text: str) -> str:
     """
     Single Groq call.
     Enables JSON mode to ensure valid output.
+    Raises CircuitOpenError while Groq is marked degraded.
     """
-    response = client.chat.completions.create(
-        model=MODEL_NAME,
-        messages=[
-            {
-                "role": "system",
-                "content": RECRUITER_SYSTEM_PROMPT
-            },
-            {
-                "role": "user",
-                "content": RECRUITER_USER_PROMPT_TEMPLATE.format(
-                    resume=resume_text.strip(),
-                    job_description=job_description_text.strip(),
-                ),
-            },
-        ],
-        
-        
-        
-        response_format={"type": "json_object"},
-        temperature=0.3,
-        max_tokens=3000,
-        timeout=60,
-    )
+    with GROQ_BREAKER.guard():
+        response = client.chat.completions.create(
+            **_completion_params(resume_text, job_description_text),
+            timeout=REQUEST_TIMEOUT,
+        )
 
     return response.choices[0].message.content.strip()
 
 
+async def _call_groq_async(
+    client: AsyncGroq,
+    resume_text: str,
+    job_description_text: str,
+    timeout: float = REQUEST_TIMEOUT,
+) -> str:
+    """
+    Single async Groq call.
+    Same request as `_call_groq`, with a caller-supplied timeout.
+    """
+    with GROQ_BREAKER.guard():
+        response = await client.chat.completions.create(
+            **_completion_params(resume_text, job_description_text),
+            timeout=timeout,
+        )
+
+    return response.choices[0].message.content.strip()
+
+
+def _remaining(loop_deadline: Optional[float]) -> float:
+    """
+    Seconds left before an absolute loop deadline, capped at REQUEST_TIMEOUT.
+    """
+    if loop_deadline is None:
+        return REQUEST_TIMEOUT
+    left = loop_deadline - asyncio.get_running_loop().time()
+    if left <= 0:
+        raise TimeoutError("Evaluation deadline exceeded")
+    return min(REQUEST_TIMEOUT, left)
+
+
+def _get_api_key() -> str:
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise RuntimeError("GROQ_API_KEY not set")
+    return api_key
+
+
 def _normalize_keys(obj: Any) -> Any:
     """
     Recursively normalize JSON keys.
@@ -130,30 +194,184 @@ def evaluate_resume_with_ai(
     *,
     resume_text: str,
     job_description_text: str,
+    hedger: Optional[Hedger] = None,
 ) -> Dict:
     """
     Authoritative evaluation entrypoint.
+
+    With hedging enabled (`hedger` or GROQ_HEDGE=1) a slow call is
+    raced against a duplicate on worker threads. Safe to call from
+    inside a running event loop either way.
+
+    While the Groq circuit is open, a provisional local keyword score
+    is returned instead (`provisional: True`).
     """
+    hedger = hedger or get_default_hedger()
 
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        raise RuntimeError("GROQ_API_KEY not set")
+    try:
+        client = Groq(api_key=_get_api_key())
+
+        def _evaluate_once() -> Dict:
+            if hedger is None:
+                return _extract_json(_call_groq(client, resume_text, job_description_text))
+            return hedger.run_sync(
+                lambda: _call_groq(client, resume_text, job_description_text),
+                _extract_json,
+            )
 
-    client = Groq(api_key=api_key)
+        try:
+            return _evaluate_once()
+
+        except ValueError as e:
+            # One retry only — if this fails, stop.
+            # Often a retry fixes a random JSON syntax glitch.
+            try:
+                return _evaluate_once()
+            except ValueError:
+                raise ValueError(
+                    "AI failed to return valid JSON after retry.\n"
+                    f"Error: {str(e)}"
+                ) from e
+
+    except CircuitOpenError:
+        return score_resume_locally(
+            resume_text=resume_text,
+            job_description_text=job_description_text,
+        )
+
+
+async def _evaluate_once_async(
+    client: AsyncGroq,
+    resume_text: str,
+    job_description_text: str,
+    loop_deadline: Optional[float],
+    hedger: Optional[Hedger],
+) -> Dict:
+    """
+    One call + JSON extraction, hedged when a hedger is given.
+    Raises ValueError if the output is not valid JSON.
+    """
+    def _call():
+        return _call_groq_async(
+            client, resume_text, job_description_text,
+            timeout=_remaining(loop_deadline),
+        )
 
-    raw = _call_groq(client, resume_text, job_description_text)
+    if hedger is None:
+        return _extract_json(await _call())
+    return await hedger.run(_call, _extract_json)
+
+
+async def evaluate_resume_with_ai_async(
+    *,
+    resume_text: str,
+    job_description_text: str,
+    client: Optional[AsyncGroq] = None,
+    deadline: Optional[float] = None,
+    hedger: Optional[Hedger] = None,
+) -> Dict:
+    """
+    Async counterpart of `evaluate_resume_with_ai`.
+
+    Same output contract and retry policy. `deadline` is a budget in
+    seconds for the whole evaluation (retry included); exceeding it
+    raises TimeoutError. Cancelling the awaiting task aborts the
+    in-flight HTTP request. Pass a shared `client` when running many
+    evaluations on one loop. `hedger` (default: GROQ_HEDGE=1) races a
+    duplicate request when a call is slow. Falls back to the provisional
+    local score while the Groq circuit is open.
+    """
+    if client is None:
+        async with AsyncGroq(api_key=_get_api_key()) as owned_client:
+            return await evaluate_resume_with_ai_async(
+                resume_text=resume_text,
+                job_description_text=job_description_text,
+                client=owned_client,
+                deadline=deadline,
+                hedger=hedger,
+            )
+
+    hedger = hedger or get_default_hedger()
+
+    loop_deadline = None
+    if deadline is not None:
+        loop_deadline = asyncio.get_running_loop().time() + deadline
 
     try:
-        return _extract_json(raw)
+        async with asyncio.timeout_at(loop_deadline):
+            try:
+                return await _evaluate_once_async(
+                    client, resume_text, job_description_text, loop_deadline, hedger,
+                )
 
-    except Exception as e:
-        # One retry only — if this fails, stop.
-        # Often a retry fixes a random JSON syntax glitch.
-        retry = _call_groq(client, resume_text, job_description_text)
-        try:
-            return _extract_json(retry)
-        except Exception:
-            raise ValueError(
-                "AI failed to return valid JSON after retry.\n"
-                f"Error: {str(e)}"
-            ) from e
+            except ValueError as e:
+                # One retry only — same policy as the sync entrypoint.
+                try:
+                    return await _evaluate_once_async(
+                        client, resume_text, job_description_text, loop_deadline, hedger,
+                    )
+                except ValueError:
+                    raise ValueError(
+                        "AI failed to return valid JSON after retry.\n"
+                        f"Error: {str(e)}"
+                    ) from e
+
+    except CircuitOpenError:
+        return score_resume_locally(
+            resume_text=resume_text,
+            job_description_text=job_description_text,
+        )
+
+
+async def evaluate_many_with_ai_async(
+    pairs: Iterable[Tuple[str, str]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    deadline: Optional[float] = None,
+    client: Optional[AsyncGroq] = None,
+    hedger: Optional[Hedger] = None,
+) -> List[Union[Dict, BaseException]]:
+    """
+    Evaluate many (resume_text, job_description_text) pairs on one loop.
+
+    At most `max_concurrency` requests are in flight at once and all of
+    them share a single client. `deadline` applies to each evaluation,
+    time spent waiting for a slot included.
+    Results keep input order; a failed evaluation yields its exception
+    instead of aborting the rest. Cancelling the caller cancels every
+    pending evaluation.
+    """
+    if client is None:
+        async with AsyncGroq(api_key=_get_api_key()) as owned_client:
+            return await evaluate_many_with_ai_async(
+                pairs,
+                max_concurrency=max_concurrency,
+                deadline=deadline,
+                client=owned_client,
+                hedger=hedger,
+            )
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(resume_text: str, job_description_text: str) -> Dict:
+        # Time spent queued for a slot counts against the deadline
+        queued_at = loop.time()
+        async with semaphore:
+            budget = None
+            if deadline is not None:
+                budget = deadline - (loop.time() - queued_at)
+                if budget <= 0:
+                    raise TimeoutError("Evaluation deadline exceeded")
+            return await evaluate_resume_with_ai_async(
+                resume_text=resume_text,
+                job_description_text=job_description_text,
+                client=client,
+                deadline=budget,
+                hedger=hedger,
+            )
+
+    return await asyncio.gather(
+        *(_bounded(r, jd) for r, jd in pairs),
+        return_exceptions=True,
+    )
@@ -0,0 +1,331 @@
+# app/bulk.py
+
+"""
+Bulk Evaluation (Groq Batch API)
+--------------------------------
+Offline re-screening of many resume/JD pairs.
+
+Turns pairs into JSONL batch files using the same request
+body as `_call_groq`, submits them, polls until done, and
+streams results through `_extract_json` and
+`validate_ai_output` into a JSONL result store.
+
+- Failed, invalid or missing lines are resubmitted
+- Already-stored ids are skipped, so interrupted runs resume
+
+Usage:
+    python -m app.bulk --input pairs.jsonl --out results.jsonl
+    python -m app.bulk --resumes resumes/ --jd jd.txt --out results.jsonl
+
+`pairs.jsonl` lines: {"id": ..., "resume_text": ..., "job_description_text": ...}
+"""
+
+import os
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from groq import Groq
+
+from app.ai_recruiter_evaluator import _completion_params, _extract_json, _get_api_key
+from app.schema import validate_ai_output
+
+
+# ---------------
+# CONFIGURATION
+# ---------------
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+COMPLETION_WINDOW = os.getenv("GROQ_BATCH_WINDOW", "24h")
+POLL_INTERVAL = float(os.getenv("GROQ_BATCH_POLL_INTERVAL", "30"))
+MAX_SUBMISSIONS = 3
+
+# Groq batch input limits
+MAX_BATCH_LINES = 50_000
+MAX_BATCH_BYTES = 100 * 1024 * 1024
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+# ---------------
+# RESULT STORE
+# ---------------
+
+class JsonlResultStore:
+    """
+    Append-only JSONL store: one {"custom_id", "result"} per line.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def completed_ids(self) -> Set[str]:
+        """
+        Ids already stored. A line that does not decode (e.g. cut
+        short by a killed run) is skipped, so its id is resubmitted.
+        """
+        if not self.path.exists():
+            return set()
+        ids = set()
+        with self.path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    ids.add(json.loads(line)["custom_id"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+        return ids
+
+    def put(self, custom_id: str, result: Dict) -> None:
+        line = json.dumps({"custom_id": custom_id, "result": result}) + "\n"
+        with self.path.open("a+b") as f:
+            # Don't append onto a partial line left by a killed run
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(line.encode("utf-8"))
+
+
+# ------------------
+# BATCH FILE I/O
+# ------------------
+
+def build_batch_files(jobs: Dict[str, Tuple[str, str]]) -> List[bytes]:
+    """
+    JSONL batch input, split to respect Groq's per-file limits.
+    `jobs` maps custom_id -> (resume_text, job_description_text).
+    """
+    files, current, size = [], [], 0
+    for custom_id, (resume_text, job_description_text) in jobs.items():
+        line = (json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": _completion_params(resume_text, job_description_text),
+        }) + "\n").encode("utf-8")
+
+        if current and (len(current) >= MAX_BATCH_LINES or size + len(line) > MAX_BATCH_BYTES):
+            files.append(b"".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+
+    if current:
+        files.append(b"".join(current))
+    return files
+
+
+def _stream_lines(client: Groq, file_id: str) -> Iterator[str]:
+    with client.files.with_streaming_response.content(file_id) as response:
+        for line in response.iter_lines():
+            if line.strip():
+                yield line
+
+
+def _parse_output_line(line: str) -> Tuple[Optional[str], Optional[Dict], Optional[str]]:
+    """
+    Returns (custom_id, validated result or None, error or None).
+    custom_id is None if the line itself is not valid JSON.
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return None, None, f"Malformed output line: {e}"
+    custom_id = record.get("custom_id")
+
+    if record.get("error"):
+        return custom_id, None, str(record["error"])
+
+    response = record.get("response") or {}
+    if response.get("status_code") != 200:
+        return custom_id, None, f"HTTP {response.get('status_code')}: {response.get('body')}"
+
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+        result = _extract_json(content)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return custom_id, None, f"Unparseable output: {e}"
+
+    ok, message = validate_ai_output(result)
+    if not ok:
+        return custom_id, None, f"Invalid output: {message}"
+    return custom_id, result, None
+
+
+# -----------------
+# BATCH LIFECYCLE
+# -----------------
+
+def submit_batch(client: Groq, data: bytes) -> str:
+    uploaded = client.files.create(file=("bulk_requests.jsonl", data), purpose="batch")
+    batch = client.batches.create(
+        completion_window=COMPLETION_WINDOW,
+        endpoint=BATCH_ENDPOINT,
+        input_file_id=uploaded.id,
+    )
+    return batch.id
+
+
+def wait_for_batch(
+    client: Groq,
+    batch_id: str,
+    *,
+    poll_interval: float = POLL_INTERVAL,
+    sleep: Callable[[float], None] = time.sleep,
+):
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            return batch
+        sleep(poll_interval)
+
+
+def collect_results(client: Groq, batch, store: JsonlResultStore) -> Dict[str, str]:
+    """
+    Stream a finished batch's output and error files into the store.
+    Returns {custom_id: error} for lines that did not produce a valid result.
+    """
+    failures: Dict[str, str] = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in _stream_lines(client, file_id):
+            custom_id, result, error = _parse_output_line(line)
+            if custom_id is None:
+                # Unattributable line; its id falls through to "No result returned"
+                continue
+            if result is not None:
+                store.put(custom_id, result)
+                failures.pop(custom_id, None)
+            else:
+                failures[custom_id] = error
+    return failures
+
+
+# ------------
+# PUBLIC API
+# ------------
+
+def run_bulk(
+    jobs: Dict[str, Tuple[str, str]],
+    store: JsonlResultStore,
+    *,
+    client: Optional[Groq] = None,
+    poll_interval: float = POLL_INTERVAL,
+    max_submissions: int = MAX_SUBMISSIONS,
+    log: Callable[[str], None] = print,
+) -> Dict:
+    """
+    Evaluate every job via the Batch API and store validated results.
+
+    Ids already in the store are skipped. Anything that fails, returns
+    invalid output, or is missing from an expired/failed batch is
+    resubmitted, up to `max_submissions` rounds.
+    """
+    client = client or Groq(api_key=_get_api_key())
+
+    done = store.completed_ids()
+    pending = {k: v for k, v in jobs.items() if k not in done}
+    failures: Dict[str, str] = {}
+    batch_ids: List[str] = []
+
+    for round_number in range(1, max_submissions + 1):
+        if not pending:
+            break
+        log(f"Round {round_number}: submitting {len(pending)} request(s)")
+
+        submitted = [submit_batch(client, data) for data in build_batch_files(pending)]
+        batch_ids += submitted
+
+        failures = {}
+        for batch_id in submitted:
+            batch = wait_for_batch(client, batch_id, poll_interval=poll_interval)
+            log(f"Batch {batch_id}: {batch.status}")
+            failures.update(collect_results(client, batch, store))
+
+        done = store.completed_ids()
+        for custom_id in pending:
+            if custom_id not in done and custom_id not in failures:
+                failures[custom_id] = "No result returned"
+        pending = {k: v for k, v in pending.items() if k not in done}
+
+    return {
+        "requested": len(jobs),
+        "stored": len(set(jobs) & done),
+        "failed": {k: failures.get(k, "Not attempted") for k in pending},
+        "batches": batch_ids,
+    }
+
+
+# ---------
+# CLI
+# ---------
+
+def _load_pairs(path: str) -> Dict[str, Tuple[str, str]]:
+    jobs = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                jobs[str(row["id"])] = (row["resume_text"], row["job_description_text"])
+    return jobs
+
+
+def _load_directory(resumes_dir: str, jd_path: str) -> Dict[str, Tuple[str, str]]:
+    from app.extraction import extract_text_from_bytes
+
+    jd_file = Path(jd_path)
+    if jd_file.suffix.lower() == ".pdf":
+        jd_text = extract_text_from_bytes(jd_file.read_bytes())
+    else:
+        jd_text = jd_file.read_text(encoding="utf-8", errors="ignore")
+    if not jd_text or not jd_text.strip():
+        raise ValueError(f"Could not read job description from {jd_path}")
+
+    jobs = {}
+    for path in sorted(Path(resumes_dir).iterdir()):
+        if path.suffix.lower() == ".pdf":
+            text = extract_text_from_bytes(path.read_bytes())
+        elif path.suffix.lower() == ".txt":
+            text = path.read_text(encoding="utf-8", errors="ignore")
+        else:
+            continue
+        if text and text.strip():
+            jobs[path.name] = (text, jd_text)
+    return jobs
+
+
+def main(argv=None) -> Dict:
+    parser = argparse.ArgumentParser(description="Bulk resume evaluation via the Groq Batch API.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="JSONL of {id, resume_text, job_description_text}")
+    source.add_argument("--resumes", help="Directory of resume PDFs/TXTs (requires --jd)")
+    parser.add_argument("--jd", help="Job description (PDF or TXT) for --resumes")
+    parser.add_argument("--out", required=True, help="JSONL result store (appended to)")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL)
+    parser.add_argument("--max-submissions", type=int, default=MAX_SUBMISSIONS)
+    args = parser.parse_args(argv)
+
+    if args.resumes and not args.jd:
+        parser.error("--resumes requires --jd")
+
+    jobs = _load_pairs(args.input) if args.input else _load_directory(args.resumes, args.jd)
+    summary = run_bulk(
+        jobs,
+        JsonlResultStore(args.out),
+        poll_interval=args.poll_interval,
+        max_submissions=args.max_submissions,
+    )
+    print(f"Stored {summary['stored']}/{summary['requested']} result(s); "
+          f"{len(summary['failed'])} failed.")
+    for custom_id, error in summary["failed"].items():
+        print(f"  {custom_id}: {error}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
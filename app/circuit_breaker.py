@@ -0,0 +1,198 @@
+# app/circuit_breaker.py
+
+"""
+Circuit Breaker
+---------------
+Stops sending traffic to Groq while it is failing or slow.
+
+- CLOSED: calls pass through; consecutive failures are counted
+- OPEN: calls fail instantly with CircuitOpenError
+- HALF_OPEN: after a cool-down, a probe call is let through;
+  success closes the circuit, failure re-opens it
+
+Only signs that Groq itself is degraded count as failures
+(connection errors, timeouts, 5xx, 429). Client-side errors
+such as 400/401 pass through without tripping the breaker.
+A call that succeeds but exceeds the slow-call threshold
+counts as a failure.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+from groq import (
+    APIConnectionError,
+    APIStatusError,
+    InternalServerError,
+    RateLimitError,
+)
+
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Groq while the circuit is open."""
+
+
+def is_groq_degraded(error: BaseException) -> bool:
+    """
+    True for errors that indicate Groq is down, slow or overloaded.
+    APITimeoutError is a subclass of APIConnectionError.
+    """
+    if isinstance(error, (APIConnectionError, InternalServerError, RateLimitError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker; usable from sync code and event loops alike.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        slow_call_threshold: float = 20.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_groq_degraded,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=int(os.getenv("GROQ_BREAKER_FAILURES", "3")),
+            slow_call_threshold=float(os.getenv("GROQ_BREAKER_SLOW_CALL", "20")),
+            reset_timeout=float(os.getenv("GROQ_BREAKER_RESET", "30")),
+        )
+
+    # -- state --------------------------------------------------------
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allows_requests(self) -> bool:
+        """
+        True unless calls would currently be rejected.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == OPEN:
+                return False
+            if self._state == HALF_OPEN:
+                return self._probes_in_flight < self.half_open_max_calls
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._times_opened,
+            }
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._times_opened += 1
+
+    # -- call accounting ---------------------------------------------
+
+    def _acquire(self) -> bool:
+        """
+        Admit a call or raise CircuitOpenError.
+        Returns True if the call is a half-open probe.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == OPEN:
+                raise CircuitOpenError("Groq circuit is open; skipping call")
+            if self._state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    raise CircuitOpenError("Groq circuit is half-open; probe in flight")
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def _on_success(self, probe: bool, latency: float) -> None:
+        if latency > self.slow_call_threshold:
+            self._on_failure(probe)
+            return
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._state = CLOSED
+                self._failures = 0
+            elif self._state == CLOSED:
+                self._failures = 0
+
+    def _on_failure(self, probe: bool) -> None:
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open()
+            elif self._state == CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._open()
+
+    def _release(self, probe: bool) -> None:
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Wrap a single Groq call.
+
+        Raises CircuitOpenError without running the body while open.
+        Errors accepted by `is_failure` count as failures; any other
+        error, and cancellation, count as neither success nor failure.
+        """
+        probe = self._acquire()
+        started = self._clock()
+        try:
+            yield
+        except BaseException as e:
+            if isinstance(e, Exception) and self.is_failure(e):
+                self._on_failure(probe)
+            else:
+                self._release(probe)
+            raise
+        else:
+            self._on_success(probe, self._clock() - started)
+
+
+# Shared by every Groq call in the process
+GROQ_BREAKER = CircuitBreaker.from_env()
@@ -0,0 +1,221 @@
+# app/consistency.py
+
+"""
+Consistency Mode
+----------------
+Multi-sample scoring for stable decisions.
+
+Runs several evaluations of the same resume/JD pair
+concurrently and aggregates `decision` and `ats_score`.
+
+- Stops early once the leading decision cannot be overturned
+- Outstanding samples are cancelled at that point
+- Failed samples count against agreement; without a quorum
+  of completed samples the result is not a consensus
+- Output keeps the normal contract plus agreement metadata
+"""
+
+import os
+import asyncio
+import statistics
+from collections import Counter
+from typing import Dict, List, Optional
+
+from groq import AsyncGroq
+
+from app.ai_recruiter_evaluator import (
+    _call_groq_async,
+    _extract_json,
+    _get_api_key,
+    _remaining,
+)
+from app.circuit_breaker import CircuitOpenError
+from app.fallback_scorer import score_resume_locally
+
+
+DEFAULT_SAMPLES = int(os.getenv("GROQ_CONSISTENCY_SAMPLES", "5"))
+
+VALID_DECISIONS = {"PASS", "BORDERLINE", "REJECT"}
+
+# Ties resolve to the least committal verdict
+DECISION_TIE_ORDER = ["BORDERLINE", "PASS", "REJECT"]
+
+
+# ------------------
+# INTERNAL HELPERS
+# ------------------
+
+def _leader(votes: Counter) -> str:
+    return max(
+        votes,
+        key=lambda d: (votes[d], -DECISION_TIE_ORDER.index(d)),
+    )
+
+
+def _is_decided(votes: Counter, outstanding: int) -> bool:
+    """
+    True when the leading decision can no longer be overturned,
+    even if every outstanding sample votes for the runner-up.
+    """
+    if not votes:
+        return False
+    counts = sorted(votes.values(), reverse=True)
+    runner_up = counts[1] if len(counts) > 1 else 0
+    return counts[0] > runner_up + outstanding
+
+
+def _quorum(requested: int) -> int:
+    return requested // 2 + 1
+
+
+def _aggregate(
+    samples: List[Dict],
+    requested: int,
+    failed: int,
+    stopped_early: bool,
+) -> Dict:
+    """
+    Consensus output from the completed `samples`.
+
+    `agreement_rate` is measured over every sample that resolved,
+    failures included, so a run where most samples failed never
+    reports full agreement. `consensus` is False below a quorum.
+    """
+    votes = Counter(s["decision"] for s in samples)
+    decision = _leader(votes)
+
+    agreeing = [s for s in samples if s["decision"] == decision]
+    # median_low is always a real sample's score, so the narrative
+    # taken from that sample quotes the same score
+    median_score = statistics.median_low(s["ats_score"] for s in agreeing)
+
+    result = dict(next(s for s in agreeing if s["ats_score"] == median_score))
+    result["agreement_rate"] = round(votes[decision] / (len(samples) + failed), 3)
+    result["consistency"] = {
+        "samples_requested": requested,
+        "samples_completed": len(samples),
+        "samples_failed": failed,
+        "consensus": len(samples) >= _quorum(requested),
+        "decision_votes": dict(votes),
+        "ats_score_range": [
+            min(s["ats_score"] for s in samples),
+            max(s["ats_score"] for s in samples),
+        ],
+        "stopped_early": stopped_early,
+    }
+    return result
+
+
+# ------------
+# PUBLIC API
+# ------------
+
+async def evaluate_resume_with_consensus_async(
+    *,
+    resume_text: str,
+    job_description_text: str,
+    samples: int = DEFAULT_SAMPLES,
+    client: Optional[AsyncGroq] = None,
+    deadline: Optional[float] = None,
+) -> Dict:
+    """
+    Run up to `samples` evaluations concurrently and return the
+    consensus result.
+
+    `decision` is the majority vote and `ats_score` the (low) median
+    score of the samples that agree with it; the narrative comes from
+    the sample with that score. `agreement_rate` and a
+    `consistency` block are added to the usual output. Samples that
+    fail or return malformed output do not vote but count against
+    `agreement_rate`; with fewer than a majority of `samples`
+    completed, `consistency["consensus"]` is False. If none succeed,
+    a ValueError is raised (or, with the Groq circuit open, the
+    provisional local score is returned).
+    """
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}")
+
+    if client is None:
+        async with AsyncGroq(api_key=_get_api_key()) as owned_client:
+            return await evaluate_resume_with_consensus_async(
+                resume_text=resume_text,
+                job_description_text=job_description_text,
+                samples=samples,
+                client=owned_client,
+                deadline=deadline,
+            )
+
+    loop_deadline = None
+    if deadline is not None:
+        loop_deadline = asyncio.get_running_loop().time() + deadline
+
+    async def _sample() -> Dict:
+        raw = await _call_groq_async(
+            client, resume_text, job_description_text,
+            timeout=_remaining(loop_deadline),
+        )
+        return _extract_json(raw)
+
+    pending = {asyncio.ensure_future(_sample()) for _ in range(samples)}
+    completed: List[Dict] = []
+    failed = 0
+    last_error: Optional[BaseException] = None
+
+    try:
+        async with asyncio.timeout_at(loop_deadline):
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        last_error = error
+                        failed += 1
+                        continue
+                    output = task.result()
+                    if (
+                        output.get("decision") in VALID_DECISIONS
+                        and isinstance(output.get("ats_score"), (int, float))
+                    ):
+                        completed.append(output)
+                    else:
+                        failed += 1
+
+                votes = Counter(s["decision"] for s in completed)
+                if len(completed) >= _quorum(samples) and _is_decided(votes, len(pending)):
+                    break
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if not completed and isinstance(last_error, CircuitOpenError):
+        return score_resume_locally(
+            resume_text=resume_text,
+            job_description_text=job_description_text,
+        )
+
+    if not completed:
+        raise ValueError(
+            "No consistency sample returned a usable result.\n"
+            f"Error: {str(last_error)}"
+        )
+
+    return _aggregate(completed, samples, failed, stopped_early=bool(pending))
+
+
+def evaluate_resume_with_consensus(
+    *,
+    resume_text: str,
+    job_description_text: str,
+    samples: int = DEFAULT_SAMPLES,
+) -> Dict:
+    """
+    Sync wrapper around `evaluate_resume_with_consensus_async`.
+    """
+    return asyncio.run(evaluate_resume_with_consensus_async(
+        resume_text=resume_text,
+        job_description_text=job_description_text,
+        samples=samples,
+    ))
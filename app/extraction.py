@@ -0,0 +1,78 @@
+# app/extraction.py
+
+"""
+Document Text Extraction
+------------------------
+Hybrid PDF ingestion: pdfplumber layout extraction,
+with a Tesseract OCR fallback for scanned documents.
+"""
+
+import io
+import asyncio
+from typing import BinaryIO, Optional, Union
+
+import pdfplumber
+import pytesseract
+from pdf2image import convert_from_bytes
+
+
+# Below this many characters the PDF is treated as a scan
+MIN_TEXT_CHARS = 50
+
+
+def extract_text_from_bytes(file_bytes: bytes) -> Optional[str]:
+    """
+    Extract text from raw PDF bytes.
+    Returns None if the document is empty or unreadable.
+    """
+    if not file_bytes:
+        return None
+
+    text = ""
+    try:
+        # Fast extraction (preserves columns/tables)
+        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+            for page in pdf.pages:
+                extracted = page.extract_text(layout=True)
+                if extracted:
+                    text += extracted + "\n"
+
+        # Fallback to OCR if text is missing (scanned PDFs)
+        if len(text.strip()) < MIN_TEXT_CHARS:
+            try:
+                images = convert_from_bytes(file_bytes)
+                ocr_text = ""
+                for img in images:
+                    ocr_text += pytesseract.image_to_string(img)
+                text = ocr_text
+            except Exception:
+                pass
+
+    except Exception:
+        return None
+
+    return text
+
+
+def extract_text_from_pdf(file: BinaryIO) -> Optional[str]:
+    """
+    Extract text from an uploaded PDF file object.
+    """
+    try:
+        return extract_text_from_bytes(file.read())
+    except Exception:
+        return None
+
+
+async def extract_text_from_pdf_async(
+    file: Union[BinaryIO, bytes],
+) -> Optional[str]:
+    """
+    Async counterpart of `extract_text_from_pdf`.
+
+    Parsing and OCR are CPU-bound, so they run in a worker thread
+    to keep the event loop responsive. Accepts a file object or bytes.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        return await asyncio.to_thread(extract_text_from_bytes, bytes(file))
+    return await asyncio.to_thread(extract_text_from_pdf, file)
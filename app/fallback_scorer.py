@@ -0,0 +1,177 @@
+# app/fallback_scorer.py
+
+"""
+Local Fallback Scorer
+---------------------
+Deterministic keyword-overlap scoring used ONLY while the
+Groq circuit is open.
+
+This is NOT a recruiter judgment. Results are labeled
+provisional and exist so the app can answer instantly
+while the LLM path is degraded. Output satisfies
+`validate_ai_output`.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List
+
+
+FALLBACK_SOURCE = "local_keyword_fallback"
+
+MAX_KEYWORDS = 25
+STEM_CHARS = 5
+
+PASS_THRESHOLD = 70
+BORDERLINE_THRESHOLD = 45
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+STOPWORDS = {
+    "a", "about", "above", "across", "after", "all", "also", "an", "and", "any",
+    "are", "as", "at", "be", "been", "being", "both", "but", "by", "can", "could",
+    "do", "does", "each", "etc", "for", "from", "has", "have", "having", "how",
+    "if", "in", "including", "into", "is", "it", "its", "least", "like", "may",
+    "more", "most", "must", "new", "not", "of", "on", "one", "or", "other", "our",
+    "out", "over", "per", "plus", "preferred", "should", "so", "such", "than",
+    "that", "the", "their", "them", "then", "there", "these", "they", "this",
+    "those", "through", "to", "up", "us", "use", "using", "via", "we", "well",
+    "what", "when", "where", "which", "while", "who", "will", "with", "within",
+    "would", "you", "your",
+    # Job-posting boilerplate
+    "ability", "able", "apply", "candidate", "candidates", "company", "description",
+    "equal", "excellent", "experience", "familiarity", "good", "help", "ideal",
+    "job", "join", "knowledge", "looking", "need", "needs", "opportunity",
+    "position", "required", "seeking",
+    "requirements", "responsibilities", "role", "skills", "strong", "team",
+    "understanding", "work", "working", "year", "years",
+}
+
+
+# ------------------
+# INTERNAL HELPERS
+# ------------------
+
+def _tokens(text: str) -> List[str]:
+    return [
+        t for t in _TOKEN_RE.findall(text.lower())
+        if len(t) > 1 and t not in STOPWORDS
+    ]
+
+
+def _top_keywords(jd_text: str) -> List[str]:
+    tokens = _tokens(jd_text)
+    counts = Counter(tokens)
+    first_seen = {}
+    for i, t in enumerate(tokens):
+        first_seen.setdefault(t, i)
+    ranked = sorted(counts, key=lambda t: (-counts[t], first_seen[t]))
+    return ranked[:MAX_KEYWORDS]
+
+
+def _decision_for(score: int) -> str:
+    if score >= PASS_THRESHOLD:
+        return "PASS"
+    if score >= BORDERLINE_THRESHOLD:
+        return "BORDERLINE"
+    return "REJECT"
+
+
+# ------------
+# PUBLIC API
+# ------------
+
+def score_resume_locally(*, resume_text: str, job_description_text: str) -> Dict:
+    """
+    Provisional keyword-overlap evaluation.
+    Same keys as the AI output, plus `provisional` and `source`.
+    """
+    keywords = _top_keywords(job_description_text)
+    resume_tokens = set(_tokens(resume_text))
+    resume_stems = {t[:STEM_CHARS] for t in resume_tokens if len(t) > STEM_CHARS}
+
+    present, weak, missing = [], [], []
+    for k in keywords:
+        if k in resume_tokens:
+            present.append(k)
+        elif len(k) > STEM_CHARS and k[:STEM_CHARS] in resume_stems:
+            weak.append(k)
+        else:
+            missing.append(k)
+
+    if keywords:
+        score = round(100 * (len(present) + 0.5 * len(weak)) / len(keywords))
+    else:
+        score = 0
+    decision = _decision_for(score)
+
+    explanation = (
+        "PROVISIONAL RESULT: the AI recruiter is temporarily unavailable, so this "
+        "score was produced by a local keyword-overlap check instead of a recruiter "
+        "review. "
+        f"{len(keywords)} key terms were taken from the job description; "
+        f"{len(present)} appear directly in the resume, {len(weak)} appear only in a "
+        f"related form and {len(missing)} were not found. "
+        "This check cannot judge context, seniority, transferable skills or the "
+        "quality of evidence, so re-run the analysis once the AI service recovers "
+        "before making any decision."
+    )
+
+    strengths = [
+        {
+            "title": f"Mentions '{k}'",
+            "jd_reference": f"Job description term: {k}",
+            "resume_reference": f"'{k}' appears in the resume",
+            "explanation": "Direct keyword match (not verified in context).",
+        }
+        for k in present[:5]
+    ]
+    gaps = [
+        {
+            "title": f"No mention of '{k}'",
+            "jd_reference": f"Job description term: {k}",
+            "resume_reference": "Not found in the resume",
+            "impact": "Keyword screens may rank the resume lower for this term.",
+        }
+        for k in missing[:5]
+    ]
+
+    suggestions = [
+        {
+            "suggestion_title": f"Address '{k}'",
+            "related_jd_requirement": f"Job description term: {k}",
+            "current_resume_state": "Not found in the resume",
+            "suggestion": f"If you have experience with {k}, state it explicitly with a concrete example.",
+            "note": "Generated by the provisional keyword check.",
+        }
+        for k in missing[:3]
+    ]
+    while len(suggestions) < 3:
+        suggestions.append({
+            "suggestion_title": "Re-run the full AI analysis",
+            "related_jd_requirement": "Overall fit",
+            "current_resume_state": "Scored by keyword overlap only",
+            "suggestion": "Repeat the analysis once the AI service is available for detailed coaching.",
+            "note": "Generated by the provisional keyword check.",
+        })
+
+    return {
+        "decision": decision,
+        "ats_score": score,
+        "decision_summary": (
+            f"Provisional {decision}: {len(present)} of {len(keywords)} key job "
+            "description terms found in the resume (AI review unavailable)."
+        ),
+        "detailed_explanation": explanation,
+        "strengths": strengths,
+        "gaps": gaps,
+        "keyword_analysis": {
+            "important_keywords_from_jd": keywords,
+            "clearly_present_in_resume": present,
+            "weak_or_implicit_in_resume": weak,
+            "missing_from_resume": missing,
+        },
+        "improvement_suggestions": suggestions,
+        "provisional": True,
+        "source": FALLBACK_SOURCE,
+    }
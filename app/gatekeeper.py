@@ -0,0 +1,201 @@
+# app/gatekeeper.py
+
+"""
+AI Gatekeeper
+-------------
+Confirms that uploaded documents really are a Resume
+and a Job Description before the evaluation runs.
+
+- AI classification first
+- Keyword heuristics only when the AI call fails
+"""
+
+import os
+import json
+import asyncio
+from typing import Optional, Tuple
+
+from groq import Groq, AsyncGroq
+
+from app.ai_recruiter_evaluator import MODEL_NAME, REQUEST_TIMEOUT
+from app.circuit_breaker import GROQ_BREAKER
+from app.prompts import CONTENT_CLASSIFIER_PROMPT_TEMPLATE
+
+
+# Analyze first 2000 chars to save tokens/time
+SNIPPET_CHARS = 2000
+
+MIN_DOCUMENT_CHARS = 50
+
+JD_INDICATORS = ["job description", "about the role", "responsibilities", "requirements"]
+RESUME_INDICATORS = ["experience", "education", "skills", "projects", "summary", "profile", "work history"]
+
+
+# ------------------
+# INTERNAL HELPERS
+# ------------------
+
+def _classifier_messages(text: str, expected_type: str) -> list:
+    prompt = CONTENT_CLASSIFIER_PROMPT_TEMPLATE.format(
+        expected_type=expected_type,
+        snippet=text[:SNIPPET_CHARS],
+    )
+    return [{"role": "user", "content": prompt}]
+
+
+def _parse_verdict(content: str) -> Tuple[bool, str]:
+    result = json.loads(content)
+    return result.get("is_valid", False), result.get("reason", "Unknown error")
+
+
+def _precheck(resume_text: str, jd_text: str) -> Optional[Tuple[bool, str]]:
+    """
+    Basic length check. Returns a verdict only when it fails.
+    """
+    if not resume_text or len(resume_text) < MIN_DOCUMENT_CHARS:
+        return False, "⚠️ The Resume file looks empty or unreadable. Please check the file."
+    if not jd_text or len(jd_text) < MIN_DOCUMENT_CHARS:
+        return False, "⚠️ The Job Description looks empty or too short."
+    return None
+
+
+def _combine(
+    resume_verdict: Tuple[Optional[bool], str],
+    jd_verdict: Tuple[Optional[bool], str],
+    resume_text: str,
+) -> Tuple[bool, str]:
+    """
+    Apply AI verdicts (when available), then the keyword fallback.
+    """
+    is_valid_res, reason_res = resume_verdict
+    if is_valid_res is not None and not is_valid_res:
+        return False, f"⚠️ Uploaded 'Resume' detected as invalid. AI says: {reason_res}"
+
+    is_valid_jd, reason_jd = jd_verdict
+    if is_valid_jd is not None and not is_valid_jd:
+        return False, f"⚠️ Uploaded 'Job Description' detected as invalid. AI says: {reason_jd}"
+
+    # Fallback Keyword Check
+    # Only matters if AI crashed (is_valid was None). Serves as backup.
+    r_lower = resume_text.lower()
+
+    # Swap Check (JD vs Resume)
+    has_jd_title = any(ind in r_lower[:200] for ind in JD_INDICATORS)
+    has_resume_content = any(ind in r_lower for ind in RESUME_INDICATORS)
+
+    if has_jd_title and not has_resume_content:
+        return False, "⚠️ It looks like you uploaded a Job Description in the 'Resume' slot."
+
+    return True, "Valid"
+
+
+# ------------
+# PUBLIC API
+# ------------
+
+def check_content_type_with_ai(text: str, expected_type: str) -> Tuple[Optional[bool], str]:
+    """
+    Asks AI to confirm if the text is a valid Resume or JD.
+    Returns (is_valid, reason); is_valid is None if the AI call failed
+    or the Groq circuit is open.
+    """
+    try:
+        client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+
+        with GROQ_BREAKER.guard():
+            response = client.chat.completions.create(
+                messages=_classifier_messages(text, expected_type),
+                model=MODEL_NAME,
+                temperature=0,
+                response_format={"type": "json_object"},
+            )
+
+        return _parse_verdict(response.choices[0].message.content)
+
+    except Exception as e:
+        # If AI fails (network/key), return None to trigger fallback
+        return None, str(e)
+
+
+async def check_content_type_with_ai_async(
+    text: str,
+    expected_type: str,
+    *,
+    client: Optional[AsyncGroq] = None,
+    timeout: float = REQUEST_TIMEOUT,
+) -> Tuple[Optional[bool], str]:
+    """
+    Async counterpart of `check_content_type_with_ai`.
+    Failures (including timeouts) return None; cancellation propagates.
+    """
+    try:
+        if client is None:
+            async with AsyncGroq(api_key=os.getenv("GROQ_API_KEY")) as owned_client:
+                return await check_content_type_with_ai_async(
+                    text, expected_type, client=owned_client, timeout=timeout,
+                )
+
+        with GROQ_BREAKER.guard():
+            response = await client.chat.completions.create(
+                messages=_classifier_messages(text, expected_type),
+                model=MODEL_NAME,
+                temperature=0,
+                response_format={"type": "json_object"},
+                timeout=timeout,
+            )
+
+        return _parse_verdict(response.choices[0].message.content)
+
+    except Exception as e:
+        return None, str(e)
+
+
+def validate_uploads(resume_text: str, jd_text: str) -> Tuple[bool, str]:
+    """
+    Length check, AI classification of both documents, keyword fallback.
+    """
+    failed = _precheck(resume_text, jd_text)
+    if failed:
+        return failed
+
+    resume_verdict = check_content_type_with_ai(resume_text, "Resume")
+    if resume_verdict[0] is False:
+        return _combine(resume_verdict, (None, ""), resume_text)
+
+    jd_verdict = check_content_type_with_ai(jd_text, "Job Description")
+    return _combine(resume_verdict, jd_verdict, resume_text)
+
+
+async def validate_uploads_async(
+    resume_text: str,
+    jd_text: str,
+    *,
+    client: Optional[AsyncGroq] = None,
+    timeout: float = REQUEST_TIMEOUT,
+    jd_verdict: Optional[Tuple[Optional[bool], str]] = None,
+) -> Tuple[bool, str]:
+    """
+    Async counterpart of `validate_uploads`.
+    Both documents are classified concurrently. Pass `jd_verdict`
+    (from `check_content_type_with_ai`) to reuse one JD check when
+    screening many resumes against the same JD.
+    """
+    failed = _precheck(resume_text, jd_text)
+    if failed:
+        return failed
+
+    if jd_verdict is not None:
+        resume_verdict = await check_content_type_with_ai_async(
+            resume_text, "Resume", client=client, timeout=timeout,
+        )
+        return _combine(resume_verdict, jd_verdict, resume_text)
+
+    resume_verdict, jd_verdict = await asyncio.gather(
+        check_content_type_with_ai_async(
+            resume_text, "Resume", client=client, timeout=timeout,
+        ),
+        check_content_type_with_ai_async(
+            jd_text, "Job Description", client=client, timeout=timeout,
+        ),
+    )
+    return _combine(resume_verdict, jd_verdict, resume_text)
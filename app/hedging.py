@@ -0,0 +1,338 @@
+# app/hedging.py
+
+"""
+Request Hedging
+---------------
+Cuts tail latency on slow Groq responses.
+
+If a call has not returned after a percentile of recently
+observed latency, a duplicate request is fired. The first
+attempt that yields valid JSON wins; the other is cancelled.
+
+- Opt-in (GROQ_HEDGE=1 or an explicit Hedger)
+- Extra spend capped by a hedge budget ratio
+- Reports hedge rate, win rate and measured tail savings:
+  a sample of losing primaries is left to finish, and the
+  gap between hedge and primary is the time saved
+"""
+
+import os
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+# Worker threads available to `Hedger.run_sync` (created on demand)
+SYNC_MAX_WORKERS = 256
+
+
+# ---------------
+# CONFIGURATION
+# ---------------
+
+@dataclass
+class HedgePolicy:
+    # Hedge once a call is slower than this percentile of recent calls
+    percentile: float = 95.0
+    # Never hedge sooner than this (seconds)
+    min_delay: float = 2.0
+    # Delay used until `min_samples` latencies have been observed
+    initial_delay: float = 15.0
+    min_samples: int = 20
+    # Number of recent latencies kept
+    window: int = 500
+    # Budget: hedges fired may not exceed this fraction of calls
+    max_hedge_ratio: float = 0.1
+    # Recorded latencies are capped here (seconds); matches the
+    # evaluator's REQUEST_TIMEOUT, after which a call would fail anyway
+    latency_cap: float = 60.0
+    # Fraction of hedge wins whose losing primary is left to finish
+    # so the saving can be measured (async path only; threads cannot
+    # be cancelled, so every losing primary is measured there)
+    measure_ratio: float = 0.25
+
+    @classmethod
+    def from_env(cls) -> "HedgePolicy":
+        defaults = cls()
+        return cls(
+            percentile=float(os.getenv("GROQ_HEDGE_PERCENTILE", defaults.percentile)),
+            min_delay=float(os.getenv("GROQ_HEDGE_MIN_DELAY", defaults.min_delay)),
+            initial_delay=float(os.getenv("GROQ_HEDGE_INITIAL_DELAY", defaults.initial_delay)),
+            min_samples=int(os.getenv("GROQ_HEDGE_MIN_SAMPLES", defaults.min_samples)),
+            window=int(os.getenv("GROQ_HEDGE_WINDOW", defaults.window)),
+            max_hedge_ratio=float(os.getenv("GROQ_HEDGE_MAX_RATIO", defaults.max_hedge_ratio)),
+            latency_cap=float(os.getenv("GROQ_HEDGE_LATENCY_CAP", defaults.latency_cap)),
+            measure_ratio=float(os.getenv("GROQ_HEDGE_MEASURE_RATIO", defaults.measure_ratio)),
+        )
+
+
+# -------------
+# HEDGER
+# -------------
+
+class Hedger:
+    """
+    Runs calls with hedging and keeps the latency window and stats.
+
+    `run` races coroutines on the caller's event loop; `run_sync`
+    races blocking calls on worker threads. Both share one window.
+    Safe to share across threads and event loops.
+    """
+
+    def __init__(self, policy: Optional[HedgePolicy] = None, *, rng: Optional[random.Random] = None):
+        self.policy = policy or HedgePolicy()
+        self._latencies = deque(maxlen=self.policy.window)
+        self._savings = deque(maxlen=self.policy.window)
+        self._lock = threading.Lock()
+        self._rng = rng or random.Random()
+        self._calls = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        # Wins where the primary was still running (a saving is possible)
+        self._hedges_overtook = 0
+        self._budget_suppressed = 0
+        self._pool: Optional[futures.ThreadPoolExecutor] = None
+        # Losing primaries left running; keeps asyncio tasks referenced
+        self._measuring = set()
+
+    # -- latency window ----------------------------------------------
+
+    def _percentile(self, samples: list, pct: float) -> float:
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def hedge_delay(self) -> float:
+        """
+        Seconds to wait on the primary attempt before hedging.
+        """
+        with self._lock:
+            samples = list(self._latencies)
+        if not samples or len(samples) < self.policy.min_samples:
+            return max(self.policy.min_delay, self.policy.initial_delay)
+        return max(self.policy.min_delay, self._percentile(samples, self.policy.percentile))
+
+    def _record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(min(seconds, self.policy.latency_cap))
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._hedges_fired + 1 > self.policy.max_hedge_ratio * self._calls:
+                self._budget_suppressed += 1
+                return False
+            self._hedges_fired += 1
+            return True
+
+    def _record_win(self, hedge_won: bool, overtook: bool) -> None:
+        """
+        `overtook`: the hedge won while the primary was still running.
+        No saving is claimed if the primary had already failed.
+        """
+        if hedge_won:
+            with self._lock:
+                self._hedges_won += 1
+                self._hedges_overtook += overtook
+
+    def _measure_loser(self, primary, started: float, won_at: float) -> None:
+        """
+        Let a primary that lost to its hedge finish, then record its
+        real latency and the time the hedge saved (`finished - won_at`).
+        If it is cancelled first (e.g. its loop shuts down), only the
+        censored `won_at` is known and no saving is recorded.
+        """
+        def _finished(attempt) -> None:
+            with self._lock:
+                self._measuring.discard(attempt)
+            if attempt.cancelled():
+                self._record_latency(won_at)
+                return
+            # Success or error: either way the caller would have waited this long
+            attempt.exception()
+            elapsed = time.monotonic() - started
+            self._record_latency(elapsed)
+            with self._lock:
+                self._savings.append(min(elapsed, self.policy.latency_cap) - won_at)
+
+        with self._lock:
+            self._measuring.add(primary)
+        primary.add_done_callback(_finished)
+
+    # -- execution ----------------------------------------------------
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[str]],
+        parse: Callable[[str], Dict],
+    ) -> Dict:
+        """
+        Run `call` (a zero-arg coroutine factory) and `parse` its output,
+        hedging with a second `call` if the first is slow.
+
+        Returns the first successfully parsed result. If every attempt
+        fails, the last error is raised.
+
+        Latency is always measured from the primary's start. When a
+        hedge wins, the primary is cancelled and recorded as a censored
+        sample (it took at least that long), except for a
+        `measure_ratio` sample that is left to finish and measured.
+        """
+        with self._lock:
+            self._calls += 1
+
+        async def _attempt() -> Dict:
+            return parse(await call())
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(_attempt())
+        pending = {primary}
+
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay())
+            if done or not self._take_budget():
+                result = await primary
+                self._record_latency(time.monotonic() - started)
+                return result
+
+            hedge = asyncio.ensure_future(_attempt())
+            pending.add(hedge)
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    elapsed = time.monotonic() - started
+                    overtook = task is hedge and primary in pending
+                    self._record_win(task is hedge, overtook)
+                    if overtook and self._rng.random() < self.policy.measure_ratio:
+                        pending.discard(primary)
+                        self._measure_loser(primary, started, elapsed)
+                    else:
+                        self._record_latency(elapsed)
+                    return task.result()
+
+            raise error
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _executor(self) -> futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = futures.ThreadPoolExecutor(
+                    max_workers=SYNC_MAX_WORKERS, thread_name_prefix="groq-hedge",
+                )
+            return self._pool
+
+    def run_sync(
+        self,
+        call: Callable[[], str],
+        parse: Callable[[str], Dict],
+    ) -> Dict:
+        """
+        Blocking counterpart of `run` for callers without an event loop
+        (or already inside one). Attempts run on worker threads.
+
+        Threads cannot be cancelled, so a losing attempt runs to its
+        own timeout in the background; its result is discarded, but a
+        losing primary's latency is measured.
+        """
+        with self._lock:
+            self._calls += 1
+
+        def _attempt() -> Dict:
+            return parse(call())
+
+        started = time.monotonic()
+        pool = self._executor()
+        primary = pool.submit(_attempt)
+
+        done, _ = futures.wait([primary], timeout=self.hedge_delay())
+        if done or not self._take_budget():
+            result = primary.result()
+            self._record_latency(time.monotonic() - started)
+            return result
+
+        hedge = pool.submit(_attempt)
+        pending = {primary, hedge}
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is not None:
+                    error = attempt.exception()
+                    continue
+                elapsed = time.monotonic() - started
+                overtook = attempt is hedge and primary in pending
+                self._record_win(attempt is hedge, overtook)
+                if overtook:
+                    self._measure_loser(primary, started, elapsed)
+                else:
+                    self._record_latency(elapsed)
+                return attempt.result()
+
+        raise error
+
+    # -- reporting ----------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        How often hedges fire and how much tail latency they save.
+
+        `mean_seconds_saved_per_win` is measured on losing primaries
+        left to finish; `estimated_seconds_saved` scales it to every
+        win that overtook a still-running primary.
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            calls = self._calls
+            fired = self._hedges_fired
+            won = self._hedges_won
+            savings = list(self._savings)
+            mean_saved = sum(savings) / len(savings) if savings else 0.0
+            return {
+                "calls": calls,
+                "hedges_fired": fired,
+                "hedge_rate": fired / calls if calls else 0.0,
+                "hedges_won": won,
+                "hedge_win_rate": won / fired if fired else 0.0,
+                "budget_suppressed": self._budget_suppressed,
+                "measured_wins": len(savings),
+                "mean_seconds_saved_per_win": round(mean_saved, 3),
+                "estimated_seconds_saved": round(mean_saved * self._hedges_overtook, 3),
+                "current_hedge_delay": round(delay, 3),
+            }
+
+
+# ------------------
+# DEFAULT INSTANCE
+# ------------------
+
+_default_hedger: Optional[Hedger] = None
+_default_lock = threading.Lock()
+
+
+def get_default_hedger() -> Optional[Hedger]:
+    """
+    Process-wide hedger, or None unless GROQ_HEDGE=1.
+    Shared so the latency window reflects all recent calls.
+    """
+    global _default_hedger
+    if os.getenv("GROQ_HEDGE", "0") != "1":
+        return None
+    with _default_lock:
+        if _default_hedger is None:
+            _default_hedger = Hedger(HedgePolicy.from_env())
+        return _default_hedger
@@ -113,3 +113,22 @@ FINAL CONSTRAINTS:
 - Every major claim must be grounded in resume or job description content.
 
 """
+
+# ----------------------------
+# DOCUMENT GATEKEEPER PROMPT
+# ----------------------------
+
+CONTENT_CLASSIFIER_PROMPT_TEMPLATE = """
+        You are a strict document classifier. 
+        Analyze the following text snippet and determine if it is a valid {expected_type}.
+        
+        Rules:
+        1. A 'Resume' must have personal details, experience, education, or skills.
+        2. A 'Job Description' must have a role title, responsibilities, or requirements.
+        3. Recipes, lyrics, essays, or code blocks are INVALID.
+        
+        Text Snippet:
+        "{snippet}"
+        
+        Respond with ONLY a JSON object: {{"is_valid": true/false, "reason": "short explanation"}}
+        """
@@ -0,0 +1,100 @@
+# app/ranking.py
+
+"""
+Candidate Ranking
+-----------------
+Server-side ranking table for batch screenings.
+
+Turns evaluated results into lightweight summary rows,
+then filters, sorts and paginates them so the UI only
+ever renders one page, whatever the size of the run.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SORTABLE_COLUMNS = ["ats_score", "candidate", "decision", "strengths", "gaps"]
+
+# Higher ranks first in the default (descending) order: PASS first
+DECISION_RANK = {"PASS": 2, "BORDERLINE": 1, "REJECT": 0}
+
+DEFAULT_PAGE_SIZE = 25
+
+
+# ------------------
+# ROW CONSTRUCTION
+# ------------------
+
+def build_ranking_rows(results: Iterable[Tuple[str, Dict]]) -> List[Dict]:
+    """
+    One summary row per (candidate name, evaluation result).
+    `id` is the position in the input, used to look up full details.
+    """
+    rows = []
+    for i, (candidate, res) in enumerate(results):
+        rows.append({
+            "id": i,
+            "candidate": candidate,
+            "decision": res.get("decision", "BORDERLINE"),
+            "ats_score": res.get("ats_score", 0),
+            "strengths": len(res.get("strengths", [])),
+            "gaps": len(res.get("gaps", [])),
+            "provisional": bool(res.get("provisional", False)),
+        })
+    return rows
+
+
+# ---------
+# QUERY
+# ---------
+
+def _sort_key(column: str):
+    if column == "decision":
+        return lambda r: DECISION_RANK.get(r["decision"], -1)
+    if column == "candidate":
+        return lambda r: r["candidate"].lower()
+    return lambda r: r[column]
+
+
+def query_ranking(
+    rows: List[Dict],
+    *,
+    decisions: Optional[Iterable[str]] = None,
+    min_score: float = 0,
+    search: str = "",
+    sort_by: str = "ats_score",
+    descending: bool = True,
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Dict], int, int]:
+    """
+    Filter, sort and slice the ranking rows.
+
+    Returns (rows for the requested page, total matching rows, page count).
+    Out-of-range pages are clamped.
+    """
+    if sort_by not in SORTABLE_COLUMNS:
+        raise ValueError(f"Cannot sort by '{sort_by}'")
+
+    wanted = set(decisions) if decisions is not None else None
+    needle = search.strip().lower()
+
+    matching = [
+        r for r in rows
+        if (wanted is None or r["decision"] in wanted)
+        and r["ats_score"] >= min_score
+        and (not needle or needle in r["candidate"].lower())
+    ]
+
+    # Stable secondary order: best score, then name
+    matching.sort(key=lambda r: r["candidate"].lower())
+    if sort_by != "ats_score":
+        matching.sort(key=lambda r: r["ats_score"], reverse=True)
+    matching.sort(key=_sort_key(sort_by), reverse=descending)
+
+    total = len(matching)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return matching[start:start + page_size], total, pages
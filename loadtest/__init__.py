@@ -0,0 +1,7 @@
+# loadtest/__init__.py
+"""
+Load Testing Harness
+--------------------
+Offline capacity and regression measurement for the
+upload-to-verdict flow against a local mock Groq server.
+"""
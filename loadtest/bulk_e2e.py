@@ -0,0 +1,75 @@
+# loadtest/bulk_e2e.py
+
+"""
+Bulk Mode End-to-End Check
+--------------------------
+Runs `app.bulk` against the mock Batch API with injected
+line failures and verifies every pair ends up stored once,
+with output that passes `validate_ai_output`.
+
+Usage:
+    python -m loadtest.bulk_e2e --pairs 200 --error-rate 0.2
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+
+from loadtest.documents import JOB_DESCRIPTION, resume_lines
+from loadtest.harness import start_mock_server
+from loadtest.mock_groq import add_profile_arguments, profile_from_args
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end check of bulk mode against the mock Batch API.")
+    parser.add_argument("--pairs", type=int, default=100)
+    add_profile_arguments(parser)
+    parser.set_defaults(error_rate=0.15, rate_limit_rate=0.05, batch_delay_s=0.2)
+    args = parser.parse_args(argv)
+
+    proc, base_url = start_mock_server(profile_from_args(args))
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["GROQ_API_KEY"] = "bulk-e2e"
+
+    from app.bulk import JsonlResultStore, run_bulk
+    from app.schema import validate_ai_output
+
+    jobs = {
+        f"cand-{i:05d}": ("\n".join(resume_lines(random.Random(i), i)), JOB_DESCRIPTION)
+        for i in range(args.pairs)
+    }
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = JsonlResultStore(os.path.join(tmp, "results.jsonl"))
+            summary = run_bulk(jobs, store, poll_interval=0.1, max_submissions=10)
+
+            with open(store.path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    ids = [r["custom_id"] for r in records]
+    problems = []
+    if summary["failed"]:
+        problems.append(f"{len(summary['failed'])} pair(s) failed: {summary['failed']}")
+    if sorted(ids) != sorted(jobs):
+        problems.append(f"stored {len(set(ids))} unique of {len(jobs)} ({len(ids)} lines)")
+    invalid = [r["custom_id"] for r in records if not validate_ai_output(r["result"])[0]]
+    if invalid:
+        problems.append(f"invalid results: {invalid}")
+
+    print(f"Batches submitted: {len(summary['batches'])}; stored: {summary['stored']}/{len(jobs)}")
+    if problems:
+        print("FAIL: " + "; ".join(problems))
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# loadtest/documents.py
+
+"""
+Synthetic Documents
+-------------------
+Generates text PDFs (resumes) and a job description so the
+load test can exercise real PDF extraction without fixtures.
+"""
+
+import random
+from typing import List
+
+
+SKILLS = [
+    "Python", "Django", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS",
+    "Terraform", "React", "TypeScript", "Redis", "Kafka", "Airflow", "Spark",
+    "Pandas", "scikit-learn", "CI/CD", "GraphQL", "Go", "Linux",
+]
+
+JOB_DESCRIPTION = """Job Description: Senior Backend Engineer
+
+About the role:
+We are hiring a backend engineer to build and scale our data platform.
+
+Responsibilities:
+- Design and operate Python services (Django / FastAPI) on AWS.
+- Own PostgreSQL schemas, Redis caching and Kafka pipelines.
+- Ship through CI/CD with Docker and Kubernetes; manage infra in Terraform.
+
+Requirements:
+- 5+ years of backend experience with Python.
+- Strong SQL and distributed-systems fundamentals.
+- Experience mentoring engineers and leading projects end to end.
+"""
+
+
+def resume_lines(rng: random.Random, index: int) -> List[str]:
+    skills = rng.sample(SKILLS, k=rng.randint(5, 10))
+    years = rng.randint(1, 12)
+    lines = [
+        f"Candidate {index:05d}",
+        f"candidate{index}@example.com | +1 555 {rng.randint(1000000, 9999999)}",
+        "",
+        "SUMMARY",
+        f"Software engineer with {years} years of experience building web services.",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EXPERIENCE",
+    ]
+    for job in range(rng.randint(2, 4)):
+        lines += [
+            f"Engineer, Company {rng.randint(1, 500)} ({2024 - job * 3 - 3} - {2024 - job * 3})",
+            f"- Built services using {rng.choice(skills)} and {rng.choice(skills)}.",
+            f"- Improved latency by {rng.randint(10, 70)}% for {rng.randint(1, 50)}k daily users.",
+            f"- Led migration of legacy systems to {rng.choice(skills)}.",
+        ]
+    lines += [
+        "",
+        "EDUCATION",
+        "B.Sc. Computer Science, State University",
+    ]
+    return lines
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(lines: List[str]) -> bytes:
+    """
+    Minimal single-page text PDF (Helvetica, one line per entry).
+    """
+    stream_lines = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+    for line in lines:
+        stream_lines.append(f"({_escape(line)}) Tj T*")
+    stream_lines.append("ET")
+    stream = "\n".join(stream_lines).encode("latin-1", errors="replace")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n".encode()
+    out += b"0000000000 65535 f \n"
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_at}\n%%EOF\n"
+    ).encode()
+    return bytes(out)
+
+
+def make_resume_pdf(rng: random.Random, index: int) -> bytes:
+    return make_pdf(resume_lines(rng, index))
@@ -0,0 +1,331 @@
+# loadtest/harness.py
+
+"""
+Load Generation Harness
+-----------------------
+Simulates many recruiters running the full flow at once:
+
+    PDF extraction -> validate_uploads -> evaluate_resume_with_ai
+
+against a local mock Groq server (started in a subprocess so it
+does not skew this process's CPU and memory figures).
+
+Reports throughput, p50/p95/p99 latency per stage (including
+time queued for a worker), CPU usage, peak RSS and, with hedging
+on, hedge rate and measured seconds saved.
+
+Usage:
+    python -m loadtest --requests 200 --concurrency 50 --latency-ms 800
+    python -m loadtest --rate 5 --error-rate 0.05 --rate-limit-rate 0.1
+    python -m loadtest --hedge --stall-rate 0.2 --stall-ms 3000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import resource
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from loadtest.documents import JOB_DESCRIPTION, make_resume_pdf
+from loadtest.mock_groq import MockProfile, add_profile_arguments, profile_from_args, profile_to_argv
+
+
+STAGES = ["queue", "extract", "validate", "evaluate", "total"]
+
+# Repository root; the mock server runs from here so `loadtest` is importable
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ----------------
+# RESULT RECORDS
+# ----------------
+
+@dataclass
+class FlowResult:
+    timings: Dict[str, float] = field(default_factory=dict)
+    failed_stage: Optional[str] = None
+    error: Optional[str] = None
+    provisional: bool = False
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# ---------------
+# MOCK SERVER
+# ---------------
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_mock_server(profile: MockProfile) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "loadtest.mock_groq", "--port", str(port)] + profile_to_argv(profile),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        cwd=PROJECT_ROOT,
+    )
+    # Wait for the "listening" line
+    line = proc.stdout.readline()
+    if "listening" not in line:
+        proc.kill()
+        raise RuntimeError(f"Mock Groq server failed to start: {line}")
+    return proc, f"http://127.0.0.1:{port}"
+
+
+# ---------------
+# FLOW
+# ---------------
+
+def run_flow(index: int, seed: int, arrived_at: Optional[float] = None) -> FlowResult:
+    """
+    One recruiter session: extract a PDF, gatekeep, evaluate.
+
+    `arrived_at` is the perf_counter time the session was submitted;
+    time spent waiting for a worker is reported as the `queue` stage
+    and included in `total`.
+    """
+    from app.extraction import extract_text_from_bytes
+    from app.gatekeeper import validate_uploads
+    from app.ai_recruiter_evaluator import evaluate_resume_with_ai
+
+    result = FlowResult()
+    pdf_bytes = make_resume_pdf(random.Random(seed + index), index)
+    started = time.perf_counter()
+    if arrived_at is None:
+        arrived_at = started
+    result.timings["queue"] = started - arrived_at
+    current = None
+
+    def _stage(name, fn):
+        nonlocal current
+        current = name
+        t0 = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            result.timings[name] = time.perf_counter() - t0
+
+    try:
+        resume_text = _stage("extract", lambda: extract_text_from_bytes(pdf_bytes))
+        if not resume_text:
+            result.failed_stage, result.error = "extract", "No text extracted"
+            return result
+
+        is_valid, message = _stage("validate", lambda: validate_uploads(resume_text, JOB_DESCRIPTION))
+        if not is_valid:
+            result.failed_stage, result.error = "validate", message
+            return result
+
+        output = _stage("evaluate", lambda: evaluate_resume_with_ai(
+            resume_text=resume_text,
+            job_description_text=JOB_DESCRIPTION,
+        ))
+        result.provisional = bool(output.get("provisional"))
+
+    except Exception as e:
+        result.failed_stage = current
+        result.error = f"{type(e).__name__}: {e}"
+        return result
+
+    finally:
+        result.timings["total"] = time.perf_counter() - arrived_at
+
+    return result
+
+
+def run_load(
+    *,
+    requests: int,
+    concurrency: int,
+    rate: Optional[float],
+    seed: int,
+) -> Tuple[List[FlowResult], float]:
+    """
+    Closed loop (rate=None): `concurrency` workers, each starting its
+    next session as soon as the previous one finishes (no queueing).
+    Open loop: Poisson arrivals at `rate`/s, capped at `concurrency`
+    in flight; time an arrival waits for a worker counts in `total`.
+    """
+    results: List[FlowResult] = []
+    lock = threading.Lock()
+    arrivals = random.Random(seed)
+
+    def _job(i, arrived_at=None):
+        r = run_flow(i, seed, arrived_at)
+        with lock:
+            results.append(r)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if not rate:
+            indices = iter(range(requests))
+
+            def _worker():
+                while True:
+                    with lock:
+                        i = next(indices, None)
+                    if i is None:
+                        return
+                    _job(i)
+
+            for _ in range(min(concurrency, requests)):
+                pool.submit(_worker)
+        else:
+            next_at = time.perf_counter()
+            for i in range(requests):
+                next_at += arrivals.expovariate(rate)
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(_job, i, time.perf_counter())
+    return results, time.perf_counter() - started
+
+
+# ---------------
+# REPORTING
+# ---------------
+
+def summarize(
+    results: List[FlowResult],
+    wall: float,
+    cpu: float,
+    hedging: Optional[Dict] = None,
+) -> Dict:
+    ok = [r for r in results if r.failed_stage is None]
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak_rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+    stages = {}
+    for stage in STAGES:
+        samples = [r.timings[stage] for r in results if stage in r.timings]
+        stages[stage] = {
+            "count": len(samples),
+            "errors": sum(r.failed_stage == stage for r in results),
+            "p50_s": round(percentile(samples, 50), 4),
+            "p95_s": round(percentile(samples, 95), 4),
+            "p99_s": round(percentile(samples, 99), 4),
+        }
+
+    errors: Dict[str, int] = {}
+    for r in results:
+        if r.error:
+            key = r.error.split(":")[0]
+            errors[key] = errors.get(key, 0) + 1
+
+    return {
+        "requests": len(results),
+        "succeeded": len(ok),
+        "provisional": sum(r.provisional for r in ok),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(ok) / wall, 3) if wall else 0.0,
+        "cpu_s": round(cpu, 3),
+        "cpu_util_pct": round(100 * cpu / wall, 1) if wall else 0.0,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "stages": stages,
+        "errors": errors,
+        "hedging": hedging,
+    }
+
+
+def print_report(summary: Dict) -> None:
+    print()
+    print(f"Requests: {summary['requests']}  succeeded: {summary['succeeded']}  "
+          f"provisional: {summary['provisional']}")
+    print(f"Wall: {summary['wall_s']}s  throughput: {summary['throughput_rps']} req/s")
+    print(f"CPU: {summary['cpu_s']}s ({summary['cpu_util_pct']}% of one core)  "
+          f"peak RSS: {summary['peak_rss_mb']} MB")
+    print()
+    print(f"{'stage':<10}{'count':>7}{'errors':>8}{'p50 (s)':>10}{'p95 (s)':>10}{'p99 (s)':>10}")
+    for stage, s in summary["stages"].items():
+        print(f"{stage:<10}{s['count']:>7}{s['errors']:>8}{s['p50_s']:>10}{s['p95_s']:>10}{s['p99_s']:>10}")
+    hedging = summary.get("hedging")
+    if hedging:
+        print()
+        print(f"Hedging: {hedging['hedges_fired']}/{hedging['calls']} calls hedged "
+              f"({100 * hedging['hedge_rate']:.1f}%), {hedging['hedges_won']} won, "
+              f"{hedging['budget_suppressed']} suppressed by budget")
+        print(f"Saved: {hedging['estimated_seconds_saved']}s total, "
+              f"{hedging['mean_seconds_saved_per_win']}s per win "
+              f"({hedging['measured_wins']} wins measured)")
+    if summary["errors"]:
+        print()
+        print("Errors:")
+        for name, count in sorted(summary["errors"].items(), key=lambda kv: -kv[1]):
+            print(f"  {count:>5}  {name}")
+
+
+# ---------
+# CLI
+# ---------
+
+def main(argv=None) -> Dict:
+    parser = argparse.ArgumentParser(description="Load-test the upload-to-verdict flow offline.")
+    parser.add_argument("--requests", type=int, default=100, help="Total sessions to run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Max sessions in flight")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Arrival rate (sessions/s, Poisson). Omit for closed loop.")
+    parser.add_argument("--base-url", default=None,
+                        help="Use an already running mock instead of starting one")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write summary JSON here")
+    parser.add_argument("--hedge", action="store_true",
+                        help="Enable request hedging (same as GROQ_HEDGE=1)")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else 0
+    proc = None
+    base_url = args.base_url
+    if base_url is None:
+        proc, base_url = start_mock_server(profile_from_args(args))
+
+    # Never hit the real API from a load test
+    os.environ["GROQ_BASE_URL"] = base_url
+    os.environ["GROQ_API_KEY"] = "loadtest"
+    if args.hedge:
+        os.environ["GROQ_HEDGE"] = "1"
+
+    from app.hedging import get_default_hedger
+    hedger = get_default_hedger()
+
+    try:
+        cpu_before = time.process_time()
+        results, wall = run_load(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            seed=seed,
+        )
+        summary = summarize(
+            results, wall, time.process_time() - cpu_before,
+            hedging=hedger.stats() if hedger is not None else None,
+        )
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    print_report(summary)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return summary
@@ -0,0 +1,414 @@
+# loadtest/mock_groq.py
+
+"""
+Mock Groq Server
+----------------
+Local stand-in for the Groq chat completions endpoint.
+
+Serves OpenAI-compatible responses with configurable
+latency, stalls, server errors and 429 rate limits, so the
+full flow can be exercised without network or API spend.
+
+Also stands in for the Batch API (file upload, batch create,
+batch status, file content) used by `app.bulk`.
+
+Run standalone:
+    python -m loadtest.mock_groq --port 8765 --latency-ms 800
+Then point the app at it with GROQ_BASE_URL=http://127.0.0.1:8765
+"""
+
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from dataclasses import dataclass
+from email.parser import BytesParser
+from email.policy import default as email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+CHAT_COMPLETIONS_PATH = "/openai/v1/chat/completions"
+FILES_PATH = "/openai/v1/files"
+BATCHES_PATH = "/openai/v1/batches"
+
+
+# ---------------
+# PROFILE
+# ---------------
+
+@dataclass
+class MockProfile:
+    # Normal response latency: mean +/- uniform jitter (ms)
+    latency_ms: float = 800.0
+    jitter_ms: float = 200.0
+    # Fraction of calls that stall for `stall_ms`
+    stall_rate: float = 0.0
+    stall_ms: float = 20000.0
+    # Fraction of calls answered with HTTP 500 / HTTP 429
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_s: float = 1.0
+    # Time a submitted batch spends in progress before completing
+    batch_delay_s: float = 1.0
+    seed: Optional[int] = None
+
+
+# ------------------
+# CANNED CONTENT
+# ------------------
+
+def _classifier_content() -> str:
+    return json.dumps({"is_valid": True, "reason": "Mock classifier: looks valid."})
+
+
+def _evaluation_content(rng: random.Random) -> str:
+    score = rng.randint(30, 95)
+    decision = "PASS" if score >= 75 else "BORDERLINE" if score >= 50 else "REJECT"
+    return json.dumps({
+        "decision": decision,
+        "ats_score": score,
+        "decision_summary": f"Mock evaluation with score {score}.",
+        "detailed_explanation": (
+            "This is a mock recruiter explanation generated by the local load-testing "
+            "server. It stands in for the model's reasoning so that schema validation, "
+            "parsing and rendering paths can be exercised at realistic payload sizes "
+            "without calling the real Groq API."
+        ),
+        "strengths": [{
+            "title": "Relevant stack",
+            "jd_reference": "Python services",
+            "resume_reference": "Built Python services",
+            "explanation": "Direct match.",
+        }],
+        "gaps": [{
+            "title": "Cloud depth",
+            "jd_reference": "Kubernetes",
+            "resume_reference": "Not mentioned",
+            "impact": "Moderate.",
+        }],
+        "keyword_analysis": {
+            "important_keywords_from_jd": ["python", "kubernetes", "sql"],
+            "clearly_present_in_resume": ["python", "sql"],
+            "weak_or_implicit_in_resume": [],
+            "missing_from_resume": ["kubernetes"],
+        },
+        "improvement_suggestions": [{
+            "suggestion_title": f"Suggestion {i}",
+            "related_jd_requirement": "Kubernetes",
+            "current_resume_state": "Missing",
+            "suggestion": "Deploy a project on Kubernetes.",
+            "note": "New skill.",
+        } for i in range(3)],
+    })
+
+
+def _is_classifier_request(body: Dict) -> bool:
+    messages = body.get("messages", [])
+    return any("document classifier" in str(m.get("content", "")) for m in messages)
+
+
+def chat_completion(body: Dict, content: str) -> Dict:
+    return {
+        "id": f"chatcmpl-mock-{random.getrandbits(48):x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+            "logprobs": None,
+        }],
+        "usage": {
+            "prompt_tokens": 1000,
+            "completion_tokens": 600,
+            "total_tokens": 1600,
+        },
+    }
+
+
+# -------------
+# HTTP SERVER
+# -------------
+
+class MockGroqHandler(BaseHTTPRequestHandler):
+    server_version = "MockGroq/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _not_found(self) -> None:
+        self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_POST(self):
+        path = self.path.rstrip("/")
+        if path == CHAT_COMPLETIONS_PATH:
+            self._handle_chat()
+        elif path == FILES_PATH:
+            self._handle_file_upload()
+        elif path == BATCHES_PATH:
+            self._handle_batch_create()
+        else:
+            self._not_found()
+
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path.startswith(BATCHES_PATH + "/"):
+            batch = self.server.batches.get(path[len(BATCHES_PATH) + 1:])
+            if batch is None:
+                return self._not_found()
+            self._send_json(200, batch)
+        elif path.startswith(FILES_PATH + "/") and path.endswith("/content"):
+            data = self.server.files.get(path[len(FILES_PATH) + 1:-len("/content")])
+            if data is None:
+                return self._not_found()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._not_found()
+
+    # -- chat completions ---------------------------------------------
+
+    def _handle_chat(self) -> None:
+        body = self._read_json()
+        profile: MockProfile = self.server.profile
+        rng: random.Random = self.server.next_rng()
+
+        roll = rng.random()
+        if roll < profile.rate_limit_rate:
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached (mock)", "type": "tokens", "code": "rate_limit_exceeded"}},
+                {"retry-after": str(profile.retry_after_s)},
+            )
+            return
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            self._send_json(500, {"error": {"message": "Internal server error (mock)", "type": "internal_server_error"}})
+            return
+
+        if rng.random() < profile.stall_rate:
+            delay_ms = profile.stall_ms
+        else:
+            delay_ms = max(0.0, profile.latency_ms + rng.uniform(-profile.jitter_ms, profile.jitter_ms))
+        time.sleep(delay_ms / 1000)
+
+        if _is_classifier_request(body):
+            content = _classifier_content()
+        else:
+            content = _evaluation_content(rng)
+        self._send_json(200, chat_completion(body, content))
+
+
+    # -- batch API ----------------------------------------------------
+
+    def _handle_file_upload(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length)
+        message = BytesParser(policy=email_policy).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + raw
+        )
+        data, filename = b"", "upload.jsonl"
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") == "file":
+                data = part.get_payload(decode=True)
+                filename = part.get_filename() or filename
+
+        file_id = self.server.store_file(data)
+        self._send_json(200, {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": "batch",
+        })
+
+    def _handle_batch_create(self) -> None:
+        body = self._read_json()
+        input_file_id = body.get("input_file_id")
+        if input_file_id not in self.server.files:
+            self._send_json(400, {"error": {"message": "Unknown input_file_id"}})
+            return
+        batch = self.server.create_batch(input_file_id, body)
+        self._send_json(200, batch)
+
+
+class MockGroqServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, profile: MockProfile, handler=MockGroqHandler):
+        super().__init__(address, handler)
+        self.profile = profile
+        self._seed_rng = random.Random(profile.seed)
+        self._rng_lock = threading.Lock()
+        # Batch API state: file id -> bytes, batch id -> batch object
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict] = {}
+
+    def handle_error(self, request, client_address):
+        # Clients cancelling in-flight calls (hedging, early stop) is expected
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+    def next_rng(self) -> random.Random:
+        # Per-request generator so handler threads never share state
+        with self._rng_lock:
+            return random.Random(self._seed_rng.getrandbits(64))
+
+    # -- batch state ----------------------------------------------------
+
+    def store_file(self, data: bytes) -> str:
+        file_id = f"file_{uuid.uuid4().hex[:24]}"
+        self.files[file_id] = data
+        return file_id
+
+    def create_batch(self, input_file_id: str, body: Dict) -> Dict:
+        batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+        batch = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": body.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": input_file_id,
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "in_progress",
+            "created_at": int(time.time()),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        self.batches[batch_id] = batch
+        threading.Thread(target=self._run_batch, args=(batch,), daemon=True).start()
+        return dict(batch)
+
+    def _run_batch(self, batch: Dict) -> None:
+        """
+        Answer every line using the live error rates (no per-call
+        latency); 429 / 500 lines go to the error file.
+        """
+        time.sleep(self.profile.batch_delay_s)
+        rng = self.next_rng()
+        outputs, errors = [], []
+
+        for line in self.files[batch["input_file_id"]].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            roll = rng.random()
+            if roll < self.profile.rate_limit_rate:
+                status, payload = 429, {"error": {"message": "Rate limit reached (mock)"}}
+            elif roll < self.profile.rate_limit_rate + self.profile.error_rate:
+                status, payload = 500, {"error": {"message": "Internal server error (mock)"}}
+            else:
+                body = request.get("body", {})
+                content = _classifier_content() if _is_classifier_request(body) else _evaluation_content(rng)
+                status, payload = 200, chat_completion(body, content)
+
+            record = {
+                "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                "custom_id": request.get("custom_id"),
+                "response": {"status_code": status, "request_id": uuid.uuid4().hex, "body": payload},
+                "error": None,
+            }
+            (outputs if status == 200 else errors).append(json.dumps(record))
+
+        if outputs:
+            batch["output_file_id"] = self.store_file(("\n".join(outputs) + "\n").encode())
+        if errors:
+            batch["error_file_id"] = self.store_file(("\n".join(errors) + "\n").encode())
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors),
+            "completed": len(outputs),
+            "failed": len(errors),
+        }
+        batch["completed_at"] = int(time.time())
+        batch["status"] = "completed"
+
+
+def serve(host: str, port: int, profile: MockProfile) -> None:
+    server = MockGroqServer((host, port), profile)
+    print(f"Mock Groq listening on http://{host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=MockProfile.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=MockProfile.jitter_ms)
+    parser.add_argument("--stall-rate", type=float, default=MockProfile.stall_rate)
+    parser.add_argument("--stall-ms", type=float, default=MockProfile.stall_ms)
+    parser.add_argument("--error-rate", type=float, default=MockProfile.error_rate)
+    parser.add_argument("--rate-limit-rate", type=float, default=MockProfile.rate_limit_rate)
+    parser.add_argument("--retry-after-s", type=float, default=MockProfile.retry_after_s)
+    parser.add_argument("--batch-delay-s", type=float, default=MockProfile.batch_delay_s)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def profile_from_args(args: argparse.Namespace) -> MockProfile:
+    return MockProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        stall_rate=args.stall_rate,
+        stall_ms=args.stall_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_s=args.retry_after_s,
+        batch_delay_s=args.batch_delay_s,
+        seed=args.seed,
+    )
+
+
+def profile_to_argv(profile: MockProfile) -> list:
+    argv = [
+        "--latency-ms", str(profile.latency_ms),
+        "--jitter-ms", str(profile.jitter_ms),
+        "--stall-rate", str(profile.stall_rate),
+        "--stall-ms", str(profile.stall_ms),
+        "--error-rate", str(profile.error_rate),
+        "--rate-limit-rate", str(profile.rate_limit_rate),
+        "--retry-after-s", str(profile.retry_after_s),
+        "--batch-delay-s", str(profile.batch_delay_s),
+    ]
+    if profile.seed is not None:
+        argv += ["--seed", str(profile.seed)]
+    return argv
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Local mock of the Groq API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, profile_from_args(args))
+
+
+if __name__ == "__main__":
+    main()
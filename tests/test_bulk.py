@@ -0,0 +1,34 @@
+# tests/test_bulk.py
+
+import json
+
+from app.bulk import JsonlResultStore
+
+
+def test_truncated_last_line_is_resubmitted(tmp_path):
+    store = JsonlResultStore(str(tmp_path / "results.jsonl"))
+    store.put("cand-1", {"decision": "PASS"})
+    store.put("cand-2", {"decision": "REJECT"})
+
+    # A killed run leaves the last record cut short
+    data = store.path.read_bytes()
+    store.path.write_bytes(data[:-12])
+
+    assert store.completed_ids() == {"cand-1"}
+
+
+def test_put_after_truncated_line_starts_a_new_line(tmp_path):
+    store = JsonlResultStore(str(tmp_path / "results.jsonl"))
+    store.put("cand-1", {"decision": "PASS"})
+    with store.path.open("ab") as f:
+        f.write(b'{"custom_id": "cand-2", "res')
+
+    store.put("cand-2", {"decision": "REJECT"})
+
+    assert store.completed_ids() == {"cand-1", "cand-2"}
+    lines = store.path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[-1]) == {"custom_id": "cand-2", "result": {"decision": "REJECT"}}
+
+
+def test_missing_store_is_empty(tmp_path):
+    assert JsonlResultStore(str(tmp_path / "none.jsonl")).completed_ids() == set()
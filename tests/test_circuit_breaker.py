@@ -0,0 +1,139 @@
+# tests/test_circuit_breaker.py
+
+import asyncio
+
+import httpx
+import pytest
+from groq import APIConnectionError, BadRequestError, InternalServerError
+
+from app.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _status_error(cls, status):
+    return cls("mock", response=httpx.Response(status, request=REQUEST), body=None)
+
+
+def _fail(breaker, error):
+    with pytest.raises(type(error)):
+        with breaker.guard():
+            raise error
+
+
+def _succeed(breaker, clock=None, duration=0.0):
+    with breaker.guard():
+        if clock is not None:
+            clock.now += duration
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        failure_threshold=3, slow_call_threshold=5.0, reset_timeout=30.0, clock=clock,
+    )
+
+
+def test_opens_after_consecutive_failures(breaker):
+    for _ in range(2):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    assert breaker.state == CLOSED
+
+    _fail(breaker, _status_error(InternalServerError, 500))
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        _succeed(breaker)
+
+
+def test_success_resets_failure_count(breaker):
+    for _ in range(2):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    _succeed(breaker)
+    _fail(breaker, APIConnectionError(request=REQUEST))
+    assert breaker.state == CLOSED
+
+
+def test_client_errors_do_not_trip(breaker):
+    for _ in range(10):
+        _fail(breaker, _status_error(BadRequestError, 400))
+    _fail(breaker, ValueError("bad json"))
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_half_open_probe_closes_on_success(breaker, clock):
+    for _ in range(3):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    clock.now += 30.0
+    assert breaker.state == HALF_OPEN
+
+    with breaker.guard():
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            _succeed(breaker)
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_reopens_on_failure(breaker, clock):
+    for _ in range(3):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    clock.now += 30.0
+    _fail(breaker, APIConnectionError(request=REQUEST))
+    assert breaker.state == OPEN
+
+    clock.now += 29.0
+    assert breaker.state == OPEN
+    clock.now += 1.0
+    assert breaker.state == HALF_OPEN
+
+
+def test_slow_success_counts_as_failure(breaker, clock):
+    for _ in range(3):
+        _succeed(breaker, clock, duration=6.0)
+    assert breaker.state == OPEN
+
+
+def test_cancelled_probe_is_released(breaker, clock):
+    for _ in range(3):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    clock.now += 30.0
+
+    _fail(breaker, asyncio.CancelledError())
+    assert breaker.state == HALF_OPEN
+
+    # The slot is free again for the next probe
+    _succeed(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_client_error_probe_is_released(breaker, clock):
+    for _ in range(3):
+        _fail(breaker, APIConnectionError(request=REQUEST))
+    clock.now += 30.0
+
+    _fail(breaker, _status_error(BadRequestError, 400))
+    assert breaker.state == HALF_OPEN
+    _succeed(breaker)
+    assert breaker.state == CLOSED
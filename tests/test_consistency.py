@@ -0,0 +1,67 @@
+# tests/test_consistency.py
+
+from collections import Counter
+
+from app.consistency import _aggregate, _is_decided, _leader
+
+
+def _sample(decision, score, summary=None):
+    return {
+        "decision": decision,
+        "ats_score": score,
+        "decision_summary": summary or f"{decision} at {score}",
+    }
+
+
+def test_is_decided_needs_unbeatable_lead():
+    assert not _is_decided(Counter(), outstanding=3)
+    assert _is_decided(Counter(PASS=3), outstanding=2)
+    assert not _is_decided(Counter(PASS=2), outstanding=2)
+    assert not _is_decided(Counter(PASS=2, REJECT=1), outstanding=1)
+    assert _is_decided(Counter(PASS=3, REJECT=1), outstanding=1)
+    assert _is_decided(Counter(REJECT=1), outstanding=0)
+
+
+def test_leader_breaks_ties_toward_least_committal():
+    assert _leader(Counter(PASS=2, REJECT=2)) == "PASS"
+    assert _leader(Counter(PASS=1, BORDERLINE=1, REJECT=1)) == "BORDERLINE"
+    assert _leader(Counter(REJECT=2, BORDERLINE=2)) == "BORDERLINE"
+    assert _leader(Counter(REJECT=3, PASS=2)) == "REJECT"
+
+
+def test_aggregate_takes_low_median_and_its_narrative():
+    samples = [
+        _sample("PASS", 80),
+        _sample("PASS", 90),
+        _sample("REJECT", 40),
+        _sample("PASS", 70),
+        _sample("PASS", 85),
+    ]
+    result = _aggregate(samples, requested=5, failed=0, stopped_early=False)
+
+    assert result["decision"] == "PASS"
+    # Agreeing scores 70, 80, 85, 90 -> low median 80
+    assert result["ats_score"] == 80
+    assert result["decision_summary"] == "PASS at 80"
+    assert result["agreement_rate"] == 0.8
+    consistency = result["consistency"]
+    assert consistency["decision_votes"] == {"PASS": 4, "REJECT": 1}
+    assert consistency["ats_score_range"] == [40, 90]
+    assert consistency["samples_failed"] == 0
+    assert consistency["consensus"] is True
+
+
+def test_aggregate_counts_failures_against_agreement():
+    # e.g. circuit half-open: one probe succeeds, the rest fail fast
+    result = _aggregate([_sample("PASS", 75)], requested=5, failed=4, stopped_early=False)
+
+    assert result["agreement_rate"] == 0.2
+    assert result["consistency"]["samples_completed"] == 1
+    assert result["consistency"]["samples_failed"] == 4
+    assert result["consistency"]["consensus"] is False
+
+
+def test_aggregate_quorum_is_a_majority_of_requested():
+    two = [_sample("REJECT", 30), _sample("REJECT", 35)]
+    assert _aggregate(two, requested=4, failed=2, stopped_early=False)["consistency"]["consensus"] is False
+    assert _aggregate(two, requested=3, failed=1, stopped_early=False)["consistency"]["consensus"] is True
@@ -0,0 +1,148 @@
+# tests/test_hedging.py
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from app.hedging import HedgePolicy, Hedger
+
+
+def _hedger(**overrides):
+    # Hedge after 50ms, with budget for every call
+    params = dict(min_delay=0.05, initial_delay=0.05, max_hedge_ratio=1.0, measure_ratio=0.0)
+    params.update(overrides)
+    return Hedger(HedgePolicy(**params))
+
+
+def _scripted(*steps):
+    """
+    Coroutine factory whose n-th call sleeps `steps[n][0]` seconds,
+    then returns `steps[n][1]` (or raises it if it is an exception).
+    """
+    calls = []
+
+    async def _call():
+        delay, outcome = steps[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return json.dumps(outcome)
+
+    return _call, calls
+
+
+def test_primary_wins_without_hedging():
+    hedger = _hedger()
+    call, calls = _scripted((0.0, {"by": "primary"}))
+
+    assert asyncio.run(hedger.run(call, json.loads)) == {"by": "primary"}
+    assert len(calls) == 1
+    stats = hedger.stats()
+    assert stats["calls"] == 1
+    assert stats["hedges_fired"] == 0
+
+
+def test_hedge_wins_and_primary_is_cancelled():
+    hedger = _hedger()
+    call, calls = _scripted((5.0, {"by": "primary"}), (0.0, {"by": "hedge"}))
+
+    assert asyncio.run(hedger.run(call, json.loads)) == {"by": "hedge"}
+    assert len(calls) == 2
+    stats = hedger.stats()
+    assert stats["hedges_fired"] == 1
+    assert stats["hedges_won"] == 1
+    assert stats["hedge_win_rate"] == 1.0
+    # Cancelled primary: nothing measured
+    assert stats["measured_wins"] == 0
+    assert stats["estimated_seconds_saved"] == 0.0
+
+
+def test_losing_primary_is_measured():
+    hedger = _hedger(measure_ratio=1.0)
+    call, _ = _scripted((0.4, {"by": "primary"}), (0.0, {"by": "hedge"}))
+
+    async def _run():
+        result = await hedger.run(call, json.loads)
+        # Let the primary finish in the background
+        await asyncio.sleep(0.5)
+        return result
+
+    assert asyncio.run(_run()) == {"by": "hedge"}
+    stats = hedger.stats()
+    assert stats["measured_wins"] == 1
+    # Primary finished at ~0.4s, hedge won at ~0.05s
+    assert 0.25 < stats["mean_seconds_saved_per_win"] < 0.4
+    assert stats["estimated_seconds_saved"] == stats["mean_seconds_saved_per_win"]
+
+
+def test_primary_wins_race_after_hedge_fired():
+    hedger = _hedger()
+    call, _ = _scripted((0.1, {"by": "primary"}), (5.0, {"by": "hedge"}))
+
+    assert asyncio.run(hedger.run(call, json.loads)) == {"by": "primary"}
+    stats = hedger.stats()
+    assert stats["hedges_fired"] == 1
+    assert stats["hedges_won"] == 0
+
+
+def test_failed_primary_falls_back_to_hedge():
+    hedger = _hedger()
+    call, _ = _scripted((0.1, ValueError("primary")), (0.2, {"by": "hedge"}))
+
+    assert asyncio.run(hedger.run(call, json.loads)) == {"by": "hedge"}
+    stats = hedger.stats()
+    assert stats["hedges_won"] == 1
+    # The primary had already failed; no saving to claim
+    assert stats["estimated_seconds_saved"] == 0.0
+
+
+def test_both_fail_raises_last_error():
+    hedger = _hedger()
+    call, calls = _scripted((0.1, ValueError("primary")), (0.1, ValueError("hedge")))
+
+    with pytest.raises(ValueError, match="hedge"):
+        asyncio.run(hedger.run(call, json.loads))
+    assert len(calls) == 2
+    assert hedger.stats()["hedges_won"] == 0
+
+
+def test_budget_suppresses_hedge():
+    hedger = _hedger(max_hedge_ratio=0.0)
+    call, calls = _scripted((0.1, {"by": "primary"}))
+
+    assert asyncio.run(hedger.run(call, json.loads)) == {"by": "primary"}
+    assert len(calls) == 1
+    stats = hedger.stats()
+    assert stats["hedges_fired"] == 0
+    assert stats["budget_suppressed"] == 1
+
+
+def test_hedge_delay_follows_recent_latency():
+    hedger = _hedger(min_delay=0.0, min_samples=3, percentile=50.0)
+    assert hedger.hedge_delay() == 0.05
+    for seconds in (0.1, 0.2, 0.3):
+        hedger._record_latency(seconds)
+    assert hedger.hedge_delay() == 0.2
+
+
+def test_run_sync_hedges_on_threads():
+    hedger = _hedger()
+    release = threading.Event()
+    outcomes = iter(["primary", "hedge"])
+
+    def _call():
+        by = next(outcomes)
+        if by == "primary":
+            release.wait(5.0)
+        return json.dumps({"by": by})
+
+    async def _inside_a_loop():
+        return hedger.run_sync(_call, json.loads)
+
+    assert asyncio.run(_inside_a_loop()) == {"by": "hedge"}
+    release.set()
+    stats = hedger.stats()
+    assert stats["hedges_won"] == 1
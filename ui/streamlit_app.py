@@ -1,24 +1,33 @@
 # ui/streamlit_app.py
 
-import sys
-import io
 import os
-import json
+import sys
+import asyncio
 from pathlib import Path
 import streamlit as st
 import plotly.graph_objects as go
-import pdfplumber
-import pytesseract
-from pdf2image import convert_from_bytes
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
 
 # --- Setup ---
 load_dotenv() # Load API keys
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.ai_recruiter_evaluator import evaluate_resume_with_ai
+from app.ai_recruiter_evaluator import (
+    DEFAULT_MAX_CONCURRENCY,
+    evaluate_resume_with_ai,
+    evaluate_many_with_ai_async,
+)
+from app.consistency import DEFAULT_SAMPLES, evaluate_resume_with_consensus
+from app.extraction import extract_text_from_pdf, extract_text_from_pdf_async
+from app.gatekeeper import check_content_type_with_ai, validate_uploads, validate_uploads_async
+from app.ranking import (
+    DEFAULT_PAGE_SIZE,
+    SORTABLE_COLUMNS,
+    build_ranking_rows,
+    query_ranking,
+)
 
 st.set_page_config(page_title="AI Recruiter Pro", page_icon="🚀", layout="wide")
 
@@ -68,37 +77,6 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# --- PDF Processing (OCR + Layout) ---
-def extract_text_from_pdf(file):
-    text = ""
-    try:
-        file_bytes = file.read()
-        if not file_bytes:
-            return None 
-            
-        # Fast extraction (preserves columns/tables)
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            for page in pdf.pages:
-                extracted = page.extract_text(layout=True)
-                if extracted:
-                    text += extracted + "\n"
-        
-        # Fallback to OCR if text is missing (scanned PDFs)
-        if len(text.strip()) < 50:
-            try:
-                images = convert_from_bytes(file_bytes)
-                ocr_text = ""
-                for img in images:
-                    ocr_text += pytesseract.image_to_string(img)
-                text = ocr_text
-            except:
-                pass 
-                
-    except Exception:
-        return None
-
-    return text
-
 # --- File Reading ---
 def read_input(file_upload, text_input):
     if file_upload:
@@ -113,85 +91,6 @@ def read_input(file_upload, text_input):
         return text_input.strip()
     return None
 
-# --- AI Content Validation ---
-def check_content_type_with_ai(text, expected_type):
-    """
-    Asks AI to confirm if the text is a valid Resume or JD.
-    Returns (is_valid, reason).
-    """
-    try:
-        client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-        
-        # Analyze first 2000 chars to save tokens/time
-        snippet = text[:2000]
-        
-        prompt = f"""
-        You are a strict document classifier. 
-        Analyze the following text snippet and determine if it is a valid {expected_type}.
-        
-        Rules:
-        1. A 'Resume' must have personal details, experience, education, or skills.
-        2. A 'Job Description' must have a role title, responsibilities, or requirements.
-        3. Recipes, lyrics, essays, or code blocks are INVALID.
-        
-        Text Snippet:
-        "{snippet}"
-        
-        Respond with ONLY a JSON object: {{"is_valid": true/false, "reason": "short explanation"}}
-        """
-        
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model="llama-3.3-70b-versatile",
-            temperature=0,
-            response_format={"type": "json_object"}
-        )
-        
-        result = json.loads(response.choices[0].message.content)
-        return result.get("is_valid", False), result.get("reason", "Unknown error")
-        
-    except Exception as e:
-        # If AI fails (network/key), return None to trigger fallback
-        return None, str(e)
-
-def validate_uploads(resume_text, jd_text):
-    # 1. Basic Length Check
-    if not resume_text or len(resume_text) < 50:
-        return False, "⚠️ The Resume file looks empty or unreadable. Please check the file."
-    if not jd_text or len(jd_text) < 50:
-        return False, "⚠️ The Job Description looks empty or too short."
-
-    # 2. AI Gatekeeper Check
-    # We try AI first. If it works, we trust it.
-    
-    # Check Resume
-    is_valid_res, reason_res = check_content_type_with_ai(resume_text, "Resume")
-    if is_valid_res is not None: # AI ran successfully
-        if not is_valid_res:
-            return False, f"⚠️ Uploaded 'Resume' detected as invalid. AI says: {reason_res}"
-            
-    # Check JD
-    is_valid_jd, reason_jd = check_content_type_with_ai(jd_text, "Job Description")
-    if is_valid_jd is not None: # AI ran successfully
-        if not is_valid_jd:
-            return False, f"⚠️ Uploaded 'Job Description' detected as invalid. AI says: {reason_jd}"
-
-    # 3. Fallback Keyword Check 
-    # Only runs if AI crashed (is_valid was None). Serves as backup.
-    r_lower = resume_text.lower()
-    
-    # Swap Check (JD vs Resume)
-    jd_indicators = ["job description", "about the role", "responsibilities", "requirements"]
-    resume_indicators = ["experience", "education", "skills", "projects", "summary", "profile", "work history"]
-    
-    has_jd_title = any(ind in r_lower[:200] for ind in jd_indicators)
-    has_resume_content = any(ind in r_lower for ind in resume_indicators)
-    
-    if has_jd_title and not has_resume_content:
-        return False, "⚠️ It looks like you uploaded a Job Description in the 'Resume' slot."
-
-    return True, "Valid"
-
 # --- Gauge Chart Component ---
 def create_gauge_chart(score):
     if score >= 75:
@@ -229,9 +128,16 @@ def create_gauge_chart(score):
 # --- Session State ---
 if "evaluation_result" not in st.session_state:
     st.session_state.evaluation_result = None
+if "batch_results" not in st.session_state:
+    st.session_state.batch_results = None
+    st.session_state.batch_errors = []
+    st.session_state.ranking_rows = []
 
 def reset_app():
     st.session_state.evaluation_result = None
+    st.session_state.batch_results = None
+    st.session_state.batch_errors = []
+    st.session_state.ranking_rows = []
     st.rerun()
 
 # --- Sidebar ---
@@ -243,75 +149,34 @@ with st.sidebar:
     st.markdown("2. **Upload Job Description** (PDF/TXT)")
     st.markdown("3. **Get AI Feedback**")
     st.markdown("---")
+    st.markdown("### ⚙️ Settings")
+    consistency_mode = st.toggle(
+        "🎯 Consistency Mode",
+        help="Runs several AI samples in parallel and reports the majority verdict. Stops early once the verdict is settled.",
+    )
+    consistency_samples = st.slider(
+        "Samples", min_value=3, max_value=9, value=DEFAULT_SAMPLES, step=2,
+        disabled=not consistency_mode,
+    )
+    st.markdown("---")
     st.info("💡 **Pro Tip:** Ensure your resume highlights impact and metrics, not just responsibilities.")
     
     # Disclaimer
     st.markdown("---")
     st.caption("⚠️ **Disclaimer:** This is a demo simulation. AI results should not replace human judgment.")
 
-# --- Main App UI ---
-st.markdown("## 🤖 Intelligent Resume Screening System")
-st.divider()
-
-if not st.session_state.evaluation_result:
-    
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("1️⃣ Candidate Resume")
-        resume_tab_file, resume_tab_text = st.tabs(["📂 Upload File", "✍️ Paste Text"])
-        with resume_tab_file:
-            resume_file = st.file_uploader("Upload Resume (PDF/TXT)", type=["txt", "pdf"], key="res_file")
-        with resume_tab_text:
-            resume_text = st.text_area("Paste Resume Content", height=300, key="res_text")
-
-    with col2:
-        st.subheader("2️⃣ Job Description")
-        jd_tab_file, jd_tab_text = st.tabs(["📂 Upload File", "✍️ Paste Text"])
-        with jd_tab_file:
-            jd_file = st.file_uploader("Upload JD (PDF/TXT)", type=["txt", "pdf"], key="jd_file")
-        with jd_tab_text:
-            jd_text = st.text_area("Paste JD Content", height=300, key="jd_text")
-
-    st.markdown("---")
-    
-    _, btn_col, _ = st.columns([1, 2, 1])
-    with btn_col:
-        analyze_btn = st.button("🔍 Analyze Profile Match", type="primary", use_container_width=True)
-
-    if analyze_btn:
-        # Read files safely
-        resume_content = read_input(resume_file, resume_text)
-        jd_content = read_input(jd_file, jd_text)
-
-        # Basic Check
-        if not resume_content or not jd_content:
-            st.error("⚠️ Please upload BOTH a Resume and a Job Description.")
-        else:
-            # Deep Validation (AI + Keyword Fallback)
-            with st.spinner("🕵️‍♂️ AI Verification: Checking document validity..."):
-                is_valid, error_msg = validate_uploads(resume_content, jd_content)
-            
-            if not is_valid:
-                st.warning(error_msg)
-            else:
-                with st.spinner("🤖 Analyzing credentials against requirements..."):
-                    try:
-                        raw_result = evaluate_resume_with_ai(
-                            resume_text=resume_content,
-                            job_description_text=jd_content,
-                        )
-                        st.session_state.evaluation_result = raw_result
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"System Error: {str(e)}")
-
 # --- Results Dashboard ---
-else:
-    res = st.session_state.evaluation_result
+def render_evaluation(res, on_reset=None):
     score = res.get("ats_score", 0)
     decision = res.get("decision", "BORDERLINE")
 
+    if res.get("provisional"):
+        st.warning(
+            "⚡ **Provisional result.** The AI recruiter is temporarily unavailable, "
+            "so this score comes from a quick keyword-overlap check. "
+            "Re-run the analysis shortly for a full AI review."
+        )
+
     col_chart, col_decision = st.columns([1, 1.5])
     
     with col_chart:
@@ -331,7 +196,24 @@ else:
             st.markdown("**Recommendation:** Do Not Proceed.")
         
         st.markdown(f"**Executive Summary:** {res['decision_summary']}")
-        st.button("🔄 Start New Analysis", on_click=reset_app)
+        if "agreement_rate" in res:
+            consistency = res["consistency"]
+            votes = [f"{d}: {n}" for d, n in consistency["decision_votes"].items()]
+            if consistency["samples_failed"]:
+                votes.append(f"failed: {consistency['samples_failed']}")
+            st.caption(
+                f"🎯 Agreement: {res['agreement_rate']:.0%} across "
+                f"{consistency['samples_completed'] + consistency['samples_failed']} samples "
+                f"({', '.join(votes)})"
+            )
+            if not consistency["consensus"]:
+                st.warning(
+                    f"Only {consistency['samples_completed']} of "
+                    f"{consistency['samples_requested']} samples completed — "
+                    "not enough for a consensus. Treat this verdict as a single opinion."
+                )
+        if on_reset:
+            st.button("🔄 Start New Analysis", on_click=on_reset)
 
     st.divider()
 
@@ -397,3 +279,283 @@ else:
             st.markdown(" ".join([f'<span class="weak-pill">~ {k}</span>' for k in weak]), unsafe_allow_html=True)
         else:
             st.write("No weak keywords detected.")
+
+# --- Batch Screening ---
+async def read_upload_async(file_upload):
+    """
+    `read_input` for one uploaded file, with PDF parsing off the event loop.
+    """
+    try:
+        if file_upload.type == "application/pdf":
+            content = await extract_text_from_pdf_async(file_upload.getvalue())
+            return content if content else ""
+        return file_upload.getvalue().decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
+
+async def _screen_batch_async(resume_files, jd_content, jd_verdict):
+    async with AsyncGroq(api_key=os.getenv("GROQ_API_KEY")) as client:
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+
+        async def _admit(f):
+            # Extract + gatekeep one resume; the JD verdict is shared
+            async with semaphore:
+                content = await read_upload_async(f)
+                is_valid, message = await validate_uploads_async(
+                    content, jd_content, client=client, jd_verdict=jd_verdict,
+                )
+                return content, is_valid, message
+
+        admitted = await asyncio.gather(*(_admit(f) for f in resume_files))
+
+        candidates, errors = [], []
+        for f, (content, is_valid, message) in zip(resume_files, admitted):
+            if is_valid:
+                candidates.append((f.name, content))
+            else:
+                errors.append((f.name, message))
+
+        outcomes = await evaluate_many_with_ai_async(
+            [(content, jd_content) for _, content in candidates],
+            client=client,
+        )
+    return candidates, outcomes, errors
+
+def screen_batch(resume_files, jd_content, jd_verdict):
+    """
+    Extract, validate and evaluate every uploaded resume against one
+    JD, concurrently. Resumes the gatekeeper rejects are reported as
+    errors, like unreadable files.
+    Returns ([(candidate, result)], [(candidate, error)]).
+    """
+    candidates, outcomes, errors = asyncio.run(
+        _screen_batch_async(resume_files, jd_content, jd_verdict)
+    )
+
+    results = []
+    for (name, _), outcome in zip(candidates, outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append((name, str(outcome)))
+        else:
+            results.append((name, outcome))
+    return results, errors
+
+def render_ranking_dashboard():
+    results = st.session_state.batch_results
+    rows = st.session_state.ranking_rows
+
+    # Summary metrics
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Candidates", len(rows))
+    m2.metric("✅ PASS", sum(r["decision"] == "PASS" for r in rows))
+    m3.metric("⚠️ BORDERLINE", sum(r["decision"] == "BORDERLINE" for r in rows))
+    m4.metric("⛔ REJECT", sum(r["decision"] == "REJECT" for r in rows))
+
+    if st.session_state.batch_errors:
+        with st.expander(f"⚠️ {len(st.session_state.batch_errors)} file(s) could not be screened"):
+            st.dataframe(
+                [{"candidate": n, "error": e} for n, e in st.session_state.batch_errors],
+                hide_index=True, use_container_width=True,
+            )
+
+    # Filters (applied server-side; only one page is sent to the browser)
+    f1, f2, f3 = st.columns([2, 1, 2])
+    with f1:
+        decisions = st.multiselect(
+            "Decision", ["PASS", "BORDERLINE", "REJECT"],
+            default=["PASS", "BORDERLINE", "REJECT"], key="ranking_decisions",
+        )
+    with f2:
+        min_score = st.slider("Min ATS Score", 0, 100, 0, key="ranking_min_score")
+    with f3:
+        search = st.text_input("Search candidate", key="ranking_search")
+
+    s1, s2, s3 = st.columns([2, 1, 1])
+    with s1:
+        sort_by = st.selectbox("Sort by", SORTABLE_COLUMNS, key="ranking_sort")
+    with s2:
+        descending = st.toggle("Descending", value=True, key="ranking_desc")
+    with s3:
+        page_size = st.selectbox(
+            "Rows per page", [10, DEFAULT_PAGE_SIZE, 50, 100], index=1, key="ranking_page_size",
+        )
+
+    page_rows, total, pages = query_ranking(
+        rows,
+        decisions=decisions,
+        min_score=min_score,
+        search=search,
+        sort_by=sort_by,
+        descending=descending,
+        page=st.session_state.get("ranking_page", 1),
+        page_size=page_size,
+    )
+    # Keep the pager in range when filters shrink the result set
+    st.session_state.ranking_page = min(st.session_state.get("ranking_page", 1), pages)
+
+    st.dataframe(
+        page_rows,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "id": None,
+            "candidate": "Candidate",
+            "decision": "Decision",
+            "ats_score": st.column_config.ProgressColumn(
+                "ATS Score", min_value=0, max_value=100, format="%d",
+            ),
+            "strengths": "Strengths",
+            "gaps": "Gaps",
+            "provisional": st.column_config.CheckboxColumn("Provisional"),
+        },
+    )
+
+    p1, p2 = st.columns([1, 3])
+    with p1:
+        st.number_input("Page", min_value=1, max_value=pages, step=1, key="ranking_page")
+    with p2:
+        st.write("")
+        st.caption(f"{total} matching candidate(s) · page {st.session_state.ranking_page} of {pages}")
+
+    st.button("🔄 Start New Screening", on_click=reset_app)
+    st.divider()
+
+    # Details are rendered only for the opened row
+    names = {r["id"]: r["candidate"] for r in page_rows}
+    opened = st.selectbox(
+        "🔎 Open candidate details",
+        options=list(names),
+        format_func=lambda i: names[i],
+        index=None,
+        placeholder="Select a candidate on this page",
+        key="ranking_opened",
+    )
+    if opened is not None:
+        st.subheader(f"📄 {results[opened][0]}")
+        render_evaluation(results[opened][1])
+
+# --- Main App UI ---
+st.markdown("## 🤖 Intelligent Resume Screening System")
+st.divider()
+
+if st.session_state.evaluation_result:
+    render_evaluation(st.session_state.evaluation_result, on_reset=reset_app)
+
+elif st.session_state.batch_results is not None:
+    render_ranking_dashboard()
+
+else:
+    screening_mode = st.radio(
+        "Mode", ["👤 Single Candidate", "👥 Batch Screening"], horizontal=True,
+        label_visibility="collapsed",
+    )
+
+    if screening_mode == "👤 Single Candidate":
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("1️⃣ Candidate Resume")
+            resume_tab_file, resume_tab_text = st.tabs(["📂 Upload File", "✍️ Paste Text"])
+            with resume_tab_file:
+                resume_file = st.file_uploader("Upload Resume (PDF/TXT)", type=["txt", "pdf"], key="res_file")
+            with resume_tab_text:
+                resume_text = st.text_area("Paste Resume Content", height=300, key="res_text")
+
+        with col2:
+            st.subheader("2️⃣ Job Description")
+            jd_tab_file, jd_tab_text = st.tabs(["📂 Upload File", "✍️ Paste Text"])
+            with jd_tab_file:
+                jd_file = st.file_uploader("Upload JD (PDF/TXT)", type=["txt", "pdf"], key="jd_file")
+            with jd_tab_text:
+                jd_text = st.text_area("Paste JD Content", height=300, key="jd_text")
+
+        st.markdown("---")
+    
+        _, btn_col, _ = st.columns([1, 2, 1])
+        with btn_col:
+            analyze_btn = st.button("🔍 Analyze Profile Match", type="primary", use_container_width=True)
+
+        if analyze_btn:
+            # Read files safely
+            resume_content = read_input(resume_file, resume_text)
+            jd_content = read_input(jd_file, jd_text)
+
+            # Basic Check
+            if not resume_content or not jd_content:
+                st.error("⚠️ Please upload BOTH a Resume and a Job Description.")
+            else:
+                # Deep Validation (AI + Keyword Fallback)
+                with st.spinner("🕵️‍♂️ AI Verification: Checking document validity..."):
+                    is_valid, error_msg = validate_uploads(resume_content, jd_content)
+            
+                if not is_valid:
+                    st.warning(error_msg)
+                else:
+                    with st.spinner("🤖 Analyzing credentials against requirements..."):
+                        try:
+                            if consistency_mode:
+                                raw_result = evaluate_resume_with_consensus(
+                                    resume_text=resume_content,
+                                    job_description_text=jd_content,
+                                    samples=consistency_samples,
+                                )
+                            else:
+                                raw_result = evaluate_resume_with_ai(
+                                    resume_text=resume_content,
+                                    job_description_text=jd_content,
+                                )
+                            st.session_state.evaluation_result = raw_result
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"System Error: {str(e)}")
+
+    else:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("1️⃣ Candidate Resumes")
+            batch_files = st.file_uploader(
+                "Upload Resumes (PDF/TXT)", type=["txt", "pdf"],
+                accept_multiple_files=True, key="batch_files",
+            )
+
+        with col2:
+            st.subheader("2️⃣ Job Description")
+            jd_tab_file, jd_tab_text = st.tabs(["📂 Upload File", "✍️ Paste Text"])
+            with jd_tab_file:
+                jd_file = st.file_uploader("Upload JD (PDF/TXT)", type=["txt", "pdf"], key="batch_jd_file")
+            with jd_tab_text:
+                jd_text = st.text_area("Paste JD Content", height=300, key="batch_jd_text")
+
+        st.markdown("---")
+
+        _, btn_col, _ = st.columns([1, 2, 1])
+        with btn_col:
+            screen_btn = st.button("👥 Screen All Candidates", type="primary", use_container_width=True)
+
+        if screen_btn:
+            jd_content = read_input(jd_file, jd_text)
+
+            if not batch_files or not jd_content:
+                st.error("⚠️ Please upload at least one Resume and a Job Description.")
+            else:
+                with st.spinner("🕵️‍♂️ AI Verification: Checking the Job Description..."):
+                    is_valid_jd, reason_jd = check_content_type_with_ai(jd_content, "Job Description")
+
+                if is_valid_jd is False:
+                    st.warning(f"⚠️ Uploaded 'Job Description' detected as invalid. AI says: {reason_jd}")
+                else:
+                    with st.spinner(f"🤖 Screening {len(batch_files)} candidates..."):
+                        try:
+                            results, errors = screen_batch(
+                                batch_files, jd_content, (is_valid_jd, reason_jd),
+                            )
+                        except Exception as e:
+                            st.error(f"System Error: {str(e)}")
+                            results = None
+
+                    if results is not None:
+                        st.session_state.batch_results = results
+                        st.session_state.batch_errors = errors
+                        st.session_state.ranking_rows = build_ranking_rows(results)
+                        st.rerun()